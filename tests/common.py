@@ -32,7 +32,7 @@ class CmdLineRunner():
         try:
             result = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
         except subprocess.CalledProcessError as err:
-            raise Error(str(err)) from err
+            raise Error(f"{err}\n{err.output.decode('utf-8').strip()}") from err
 
         if not result:
             return None
@@ -59,6 +59,18 @@ class CmdLineRunner():
 
         return self._command(cmd)
 
+    def output(self, cmd, arg=None):
+        """
+        Run commandline tool with arguments and return the output. Unlike 'command()', never add
+        the '-o' option, so that the output is not redirected to a file.
+        """
+
+        cmd = [self._tool_path, cmd]
+        if arg:
+            cmd += arg.split()
+
+        return self._command(cmd)
+
     def __init__(self, toolname, devid, tmpdir=None):
         """The constructor."""
 
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2019-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Antti Laakso <antti.laakso@linux.intel.com>
+
+"""Test module for 'wult' project. Unit tests for the 'Deploy' module helpers."""
+
+# pylint: disable=protected-access
+
+import argparse
+import subprocess
+from pathlib import Path
+import pytest
+from pepclibs.helperlibs import LocalProcessManager
+from pepclibs.helperlibs.Exceptions import Error
+from wultlibs import Deploy
+
+_SRCDIR = Path(__file__).parent.parent.resolve()
+
+# The in-tree directories with a 'list_deployables' 'make' target.
+_DEPLOYABLE_DIRS = ("helpers/ndlrunner", "helpers/stats-collect", "drivers/idle/ndl",
+                    "drivers/idle/wult")
+
+class _FakeRemotePman():
+    """
+    A fake remote process manager, which returns canned 'run()' results. Used for testing how the
+    command output is parsed without a remote host.
+    """
+
+    is_remote = True
+    hostname = "fakehost"
+    hostmsg = " on fakehost"
+
+    def __init__(self, stdout, stderr="", exitcode=0):
+        """The constructor."""
+
+        self._result = (stdout, stderr, exitcode)
+        self.cmds = []
+
+    def run(self, cmd, **kwargs): # pylint: disable=unused-argument
+        """Record the command and return the canned result."""
+
+        self.cmds.append(cmd)
+        return self._result
+
+    @staticmethod
+    def cmd_failed_msg(cmd, stdout, stderr, exitcode):
+        """Format a command failure message."""
+
+        return f"command '{cmd}' failed with exit code {exitcode}:\n{stdout}{stderr}"
+
+def _build_deploy_parser(**kwargs):
+    """Build an 'argparse' parser with just the 'deploy' command and return the 'deploy' parser."""
+
+    parser = argparse.ArgumentParser(prog="wult")
+    subparsers = parser.add_subparsers(title="commands", dest="a command")
+    Deploy.add_deploy_cmdline_args(subparsers, "wult", Deploy.deploy_command, **kwargs)
+    return subparsers.choices["deploy"]
+
+def test_deploy_spec_cached():
+    """
+    Test that the 'deploy' command description is built only once, and that building parsers from
+    the cached description does not change it.
+    """
+
+    Deploy._get_deploy_spec.cache_clear()
+
+    kwargs = {"drivers" : True, "helpers" : ["ndlrunner"], "pyhelpers" : ["stats-collect"]}
+    parser1 = _build_deploy_parser(**kwargs)
+    parser2 = _build_deploy_parser(**kwargs)
+
+    info = Deploy._get_deploy_spec.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+    spec = Deploy._get_deploy_spec("wult", True, ("ndlrunner",), ("stats-collect",))
+    assert spec is Deploy._get_deploy_spec("wult", True, ("ndlrunner",), ("stats-collect",))
+    assert parser1.description == parser2.description == spec["descr"]
+    assert parser1.format_help() == parser2.format_help()
+    assert "ndlrunner, stats-collect" in spec["descr"]
+
+    args = parser2.parse_args(["--kernel-src", "/tmp/ksrc"])
+    assert str(args.ksrc) == "/tmp/ksrc"
+    assert args.helpers == ["ndlrunner"]
+    assert args.pyhelpers == ["stats-collect"]
+
+def test_deploy_spec_variants():
+    """Test that different 'deploy' command variants do not share the cached description."""
+
+    drivers_only = Deploy._get_deploy_spec("wult", True, (), ())
+    helpers_only = Deploy._get_deploy_spec("wult", False, ("ndlrunner",), ())
+
+    assert drivers_only is not helpers_only
+    assert drivers_only["help"] == "Compile and deploy wult drivers."
+    assert helpers_only["help"] == "Compile and deploy wult helpers."
+    assert [args for args, _, _ in drivers_only["args"]] == [("--kernel-src",)]
+    assert not helpers_only["args"]
+
+def test_get_mtimes_local(tmp_path):
+    """Test '_get_mtimes()' on the local host, missing files are not included in the result."""
+
+    path = tmp_path / "file"
+    path.write_text("")
+    missing = tmp_path / "missing"
+
+    pman = LocalProcessManager.LocalProcessManager()
+    mtimes = Deploy._get_mtimes(pman, [path, missing])
+
+    assert list(mtimes) == [path]
+    assert abs(mtimes[path] - path.stat().st_mtime) < 1
+
+def test_get_mtimes_remote():
+    """Test '_get_mtimes()' output parsing and error handling for remote hosts."""
+
+    paths = [Path("/a/b"), Path("/a/c d"), Path("/missing")]
+    pman = _FakeRemotePman("100 /a/b\n200 /a/c d\n",
+                           "stat: cannot stat '/missing': No such file or directory\n", 1)
+    assert Deploy._get_mtimes(pman, paths) == {Path("/a/b") : 100, Path("/a/c d") : 200}
+    assert len(pman.cmds) == 1
+
+    pman = _FakeRemotePman("")
+    assert not Deploy._get_mtimes(pman, [])
+    assert not pman.cmds
+
+    # Failures other than missing files must not be mistaken for missing files.
+    for stdout, stderr, exitcode in (("", "ssh: connect to host: Connection refused\n", 255),
+                                     ("100 /a/b\n", "stat: cannot stat '/a/c d': Permission "
+                                                     "denied\n", 1),
+                                     ("", "", 1),
+                                     ("garbage\n", "", 0)):
+        pman = _FakeRemotePman(stdout, stderr, exitcode)
+        with pytest.raises(Error):
+            Deploy._get_mtimes(pman, paths)
+
+@pytest.mark.parametrize("subpath", _DEPLOYABLE_DIRS)
+def test_parse_deployables(subpath):
+    """Test that '_parse_deployables()' agrees with 'make list_deployables'."""
+
+    srcpath = _SRCDIR / subpath
+    cmd = ["make", "--silent", "-C", str(srcpath), "list_deployables"]
+    expected = subprocess.check_output(cmd).decode("utf-8").split()
+
+    assert Deploy._parse_deployables(srcpath) == expected
+
+def test_parse_deployables_fallback(tmp_path):
+    """Test that '_parse_deployables()' returns 'None' for makefiles it cannot parse."""
+
+    assert Deploy._parse_deployables(tmp_path) is None
+
+    (tmp_path / "Makefile").write_text("list_deployables:\n\t@$(MAKE) -C sub list_deployables\n")
+    assert Deploy._parse_deployables(tmp_path) is None
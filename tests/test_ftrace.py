@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2019-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Antti Laakso <antti.laakso@linux.intel.com>
+
+"""Test module for 'wult' project. Unit tests for the '_FTrace' module trace lines parsing."""
+
+# pylint: disable=protected-access
+
+from wultlibs import _FTrace
+
+def test_ftline_re():
+    """Test '_FTLINE_RE' with various process names, including ones with '-' and spaces."""
+
+    msg = "LDist=1000 LTime=12345 TBI=99 TAI=101"
+    tail = f"[001] d.h. 12345.678901: wult_cpu_idle: {msg}"
+
+    for procname, pid in (("<idle>", "0"),
+                          ("bash", "1"),
+                          ("systemd-udevd", "1234"),
+                          ("kworker/u8:2-events", "77"),
+                          ("Web Content", "4321"),
+                          ("gdbus-x y-z", "56")):
+        match = _FTrace._FTLINE_RE.match(f"{procname}-{pid} {tail}")
+        assert match
+        assert match.group("procname") == procname
+        assert match.group("pid") == pid
+        assert match.group("cpunum") == "[001]"
+        assert match.group("flags") == "d.h."
+        assert match.group("timestamp") == "12345.678901:"
+        assert match.group("func") == "wult_cpu_idle:"
+        assert match.group("msg") == msg
+
+def test_ftline_re_nomatch():
+    """Test that '_FTLINE_RE' does not match lines which are not trace events."""
+
+    assert not _FTrace._FTLINE_RE.match("# tracer: nop")
+    assert not _FTrace._FTLINE_RE.match("bash 1 [001] d.h. 12345.678901: wult_cpu_idle: LDist=1")
@@ -13,11 +13,16 @@ Test module for 'wult' project. Tests following commands for 'wult' and 'ndl':
 - filter
 - report
 - calc
+
+Also verifies that 'filter' prints the same output regardless of whether it loads all the datapoints
+at once or reads them in chunks.
 """
 
 # pylint: disable=redefined-outer-name
 # pylint: disable=unused-import
 
+import pytest
+from pepclibs.helperlibs.Exceptions import Error
 from common import tool
 
 def test_good_input_data(tool):
@@ -28,3 +33,24 @@ def test_good_input_data(tool):
             if cmd == "filter":
                 args = f"--rfilt index!=0 {args}"
             tool.command(cmd, args)
+
+def test_filter_chunked(tool):
+    """
+    Test that 'filter' prints the same output when only columns are selected (the datapoints are
+    read in chunks) and when a rows filter is used as well (all the datapoints are loaded at once).
+    The rows filter does not match any datapoint. The columns are selected in the CSV file order,
+    because the rows filter makes 'filter' print the columns in the selector order. Also test that
+    both ways fail the same way when no columns are left.
+    """
+
+    # The first column is 'RTD' in 'ndl' results and 'WakeLatency' in 'wult' results.
+    csel = "(RTD|WakeLatency),LDist"
+
+    for path in tool.good_paths:
+        chunked = tool.output("filter", f"--csel {csel} {path}")
+        loaded = tool.output("filter", f"--csel {csel} --rfilt index<0 {path}")
+        assert chunked == loaded
+
+        for args in (f"--cfilt .* {path}", f"--cfilt .* --rfilt index<0 {path}"):
+            with pytest.raises(Error, match="no data left after applying column selector"):
+                tool.output("filter", args)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2019-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: Antti Laakso <antti.laakso@linux.intel.com>
+
+"""Test module for 'wult' project. Unit tests for the 'ToolsCommon' module helpers."""
+
+# pylint: disable=protected-access
+
+import io
+from pathlib import Path
+import numpy
+import pandas
+import pytest
+import yaml
+from pepclibs.helperlibs.Exceptions import Error
+from wultlibs import ToolsCommon
+
+_TESTDATA = Path(__file__).parent.resolve() / "testdata"
+
+def test_count_csv_rows(tmp_path):
+    """Test '_count_csv_rows()'."""
+
+    path = tmp_path / "datapoints.csv"
+
+    for contents, expected in (("", 0),
+                               ("RTD,LDist\n", 0),
+                               ("RTD,LDist", 0),
+                               ("RTD,LDist\n1,2\n", 1),
+                               ("RTD,LDist\n1,2\n3,4", 2),
+                               ("RTD,LDist\n1,2\n3,4\n5,6\n", 3)):
+        path.write_text(contents)
+        assert ToolsCommon._count_csv_rows(path) == expected
+
+    with pytest.raises(Error):
+        ToolsCommon._count_csv_rows(tmp_path / "nonexistent.csv")
+
+def test_count_csv_rows_testdata():
+    """Test '_count_csv_rows()' against the test data."""
+
+    path = _TESTDATA / "ndl" / "good" / "datapoints.csv"
+    with open(path, "r") as fobj:
+        expected = len(fobj.readlines()) - 1
+
+    assert ToolsCommon._count_csv_rows(path) == expected
+
+def test_split_csv_line():
+    """Test '_split_csv_line()'."""
+
+    for line, expected in (("", []),
+                           ("a", ["a"]),
+                           ("a,b", ["a", "b"]),
+                           (" a , b ,c ", ["a", "b", "c"]),
+                           ("a,,b", ["a", "b"]),
+                           (",a,", ["a"]),
+                           ("RTD, CC1% , 99.9%", ["RTD", "CC1%", "99.9%"])):
+        assert ToolsCommon._split_csv_line(line) == expected
+
+    assert ToolsCommon._split_csv_line(None) == []
+
+def test_dump_smrys():
+    """Test '_dump_smrys()' with summaries it is able to handle."""
+
+    smrys = {"RTD": {"min": 1.0, "avg": 12.345, "99.9%": 100.005, "N": 10},
+             "CC1%": {"max": 2}}
+
+    fobj = io.StringIO()
+    assert ToolsCommon._dump_smrys(smrys, fobj)
+    assert fobj.getvalue() == "RTD:\n" \
+                              "  min: 1.00\n" \
+                              "  avg: 12.35\n" \
+                              "  99.9%: 100.00\n" \
+                              "  N: 10\n" \
+                              "CC1%:\n" \
+                              "  max: 2\n"
+
+    fobj = io.StringIO()
+    assert ToolsCommon._dump_smrys({}, fobj)
+    assert fobj.getvalue() == ""
+
+def test_dump_smrys_unsupported():
+    """
+    Test that '_dump_smrys()' refuses summaries it cannot format, and writes nothing in this case.
+    """
+
+    for smrys in ({"RTD": {}},
+                  {"RTD Delta": {"min": 1.0}},
+                  {"RTD": {"min value": 1.0}},
+                  {"RTD": {"min": "1.0"}},
+                  {"RTD": {"min": None}},
+                  {"RTD": {"min": True}},
+                  {"RTD": {"min": 1.0}, "-RTD": {"min": 1.0}}):
+        fobj = io.StringIO()
+        assert not ToolsCommon._dump_smrys(smrys, fobj)
+        assert fobj.getvalue() == ""
+
+    # Names which YAML loaders resolve to booleans or null have to be quoted.
+    for name in ("on", "Off", "YES", "no", "true", "False", "null", "NULL"):
+        for smrys in ({name: {"min": 1.0}}, {"RTD": {name: 1.0}}):
+            fobj = io.StringIO()
+            assert not ToolsCommon._dump_smrys(smrys, fobj)
+            assert fobj.getvalue() == ""
+
+def test_dump_smrys_loads_back():
+    """Test that the '_dump_smrys()' output loads back the same as the 'yaml.dump()' output."""
+
+    smrys = {"RTD": {"min": 1.0, "99.999%": 2.5, "N": 10},
+             "CC1%": {"max": 2.25},
+             "None": {"online": 3.0},
+             "Yes.1": {"_on": 0.5}}
+
+    fobj = io.StringIO()
+    assert ToolsCommon._dump_smrys(smrys, fobj)
+    assert yaml.safe_load(fobj.getvalue()) == yaml.safe_load(yaml.dump(smrys))
+
+def test_parse_dpcnt():
+    """Test 'parse_dpcnt()'."""
+
+    assert ToolsCommon.parse_dpcnt(1) == 1
+    assert ToolsCommon.parse_dpcnt("1000000") == 1000000
+    assert ToolsCommon.parse_dpcnt(" 10 ") == 10
+
+    for dpcnt in (0, "0", -1, "-5", "1.5", "abc", "", None):
+        with pytest.raises(Error):
+            ToolsCommon.parse_dpcnt(dpcnt)
+
+def _check_write_csv(df):
+    """Check that '_write_csv()' output for 'df' is the same as 'df.to_csv()' output."""
+
+    for header in (True, False):
+        expected = io.StringIO()
+        df.to_csv(expected, index=False, header=header)
+        fobj = io.StringIO()
+        ToolsCommon._write_csv(df, fobj, header=header)
+        assert fobj.getvalue() == expected.getvalue()
+
+def test_write_csv():
+    """
+    Test that '_write_csv()' writes exactly the same CSV as 'pandas.DataFrame.to_csv()', including
+    missing values and values which require quoting.
+    """
+
+    df = pandas.DataFrame({"RTD" : [1.5, numpy.nan, 0.1, 1e20, 3.0],
+                           "LDist" : [1, 2, 3, 4, 5],
+                           "Name" : ["a", None, "b,c", 'q"q', numpy.nan],
+                           "Flag" : [True, False, True, False, True],
+                           "Empty" : [numpy.nan] * 5})
+    _check_write_csv(df)
+    _check_write_csv(df.iloc[0:0])
+
+    for subpath in ("wult/good", "ndl/good"):
+        _check_write_csv(pandas.read_csv(_TESTDATA / subpath / "datapoints.csv"))
@@ -115,15 +115,23 @@ def calc_col_smry(df, colname, funcnames=None):
         # function name.
         get_smry_func_descr(funcname)
 
+    col = df[colname]
+
+    # Calculate all the percentiles in one go, which is cheaper than calculating them one by one.
+    pfnames = [fname for fname in fnames if fname not in fmap and fname != "nzcnt"]
+    percentiles = {}
+    if pfnames:
+        quantiles = col.quantile([_get_percentile(fname) / 100 for fname in pfnames])
+        percentiles = dict(zip(pfnames, quantiles.tolist()))
+
+    for funcname in fnames:
         if funcname in fmap:
             # Other summaries can be handled in a generic way.
-            datum = getattr(df[colname], fmap[funcname])()
+            datum = getattr(col, fmap[funcname])()
         elif funcname == "nzcnt":
-            datum = int((df[colname] != 0).sum())
+            datum = int((col != 0).sum())
         else:
-            # Handle percentiles separately.
-            percent = _get_percentile(funcname)
-            datum = df[colname].quantile(percent / 100)
+            datum = percentiles[funcname]
 
         if numpy.isnan(datum):
             return {}, None
@@ -137,7 +145,7 @@ def calc_col_smry(df, colname, funcnames=None):
                 # This makes sure that the order is the same as in 'funcnames'.
                 smry[funcname] = None
             smry[idx_funcname] = datum
-            datum = df[colname].loc[datum]
+            datum = col.loc[datum]
 
         smry[funcname] = datum
     return smry
@@ -10,10 +10,23 @@
 This module provides the base class for APIs to the datapoints CSV file definitions (AKA 'defs').
 """
 
+import copy
 from pathlib import Path
+from functools import lru_cache
 from pepclibs.helperlibs import YAML
 from wultlibs import Deploy
 
+@lru_cache(maxsize=None)
+def _load_defs(name):
+    """
+    Find and load the definitions file for tool 'name'. Returns a '(path, info)' tuple, where 'path'
+    is the definitions file path and 'info' is the loaded dictionary. The definitions files do not
+    change at run-time, so they are loaded only once. The caller must not modify 'info'.
+    """
+
+    path = Deploy.find_app_data("wult", Path(f"defs/{name}.yml"), appname=name,
+                                descr=f"{name} datapoints definitions file")
+    return path, YAML.load(path)
 
 class DefsBase:
     """
@@ -104,6 +117,5 @@ class DefsBase:
         self.name = name
         self.info = None
         self.vanilla_info = None
-        self.path = Deploy.find_app_data("wult", Path(f"defs/{name}.yml"), appname=name,
-                                         descr=f"{name} datapoints definitions file")
-        self.info = self.vanilla_info = self._mangle(YAML.load(self.path))
+        self.path, info = _load_defs(name)
+        self.info = self.vanilla_info = self._mangle(copy.deepcopy(info))
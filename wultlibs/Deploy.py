@@ -11,12 +11,15 @@ This module provides various functions impelementing the 'wult' and 'ndl' tools
 """
 
 import os
+import re
 import sys
+import json
 import time
 import zipfile
 import logging
 import contextlib
 from pathlib import Path
+from functools import lru_cache
 from pepclibs.helperlibs import LocalProcessManager, Trivial, FSHelpers, Logging, ArgParse
 from pepclibs.helperlibs import WrapExceptions
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound
@@ -29,6 +32,98 @@ _HELPERS_SRC_SUBPATH = Path("helpers")
 
 _LOG = logging.getLogger()
 
+# The local host and SUT time shift cache, host names are the keys and '(timestamp, time_delta)'
+# tuples are the values. The time shift is re-checked after '_TIME_DELTA_TTL' seconds.
+_TIME_DELTA_CACHE = {}
+_TIME_DELTA_TTL = 60
+
+# The SUT kernel version cache, host names are the keys and '(timestamp, kver)' tuples are the
+# values. '_probe_sut()' fills it too, so that checking the deployment state right after deploying
+# does not ask the SUT again. The kernel version is re-checked after '_KVER_TTL' seconds.
+_KVER_CACHE = {}
+_KVER_TTL = 60
+
+# How long, in seconds, the deployment state cached in the local deployment state file is valid.
+# Within this time, if the sources and the SUT kernel version did not change, 'is_deploy_needed()'
+# trusts the cached state and does not check the SUT files.
+_DEPLOY_STATE_TTL = 3600
+
+# The "deployables" lists cache, '(srcpath, hostname)' tuples are the keys. The source trees do not
+# change at run-time, and running 'make' for every lookup is slow.
+_DEPLOYABLES_CACHE = {}
+
+# Regular expressions for parsing the simple makefiles of drivers and helpers: the 'list_deployables'
+# recipe, variable assignments, and variable references.
+_ECHO_RECIPE_RE = re.compile(r"^\t@echo\s+(.*?)\s*$")
+_MAKE_ASSIGN_RE = re.compile(r"^(?P<name>\w+)\s*(?P<op>[:?+]?=)\s*(?P<value>.*?)\s*$")
+_MAKE_VAR_RE = re.compile(r"\$\((\w+)\)")
+
+@lru_cache(maxsize=None)
+def _get_searchdirs_descr(toolname, subpath):
+    """
+    Return the comma-separated list of directories the 'toolname' tool searches for the 'subpath'
+    sub-directory in (e.g., the drivers sources), for the '--help' text of the 'deploy' command.
+    """
+
+    envarname = f"{toolname.upper()}_DATA_PATH"
+    searchdirs = (f"{Path(sys.argv[0]).parent}/%s",
+                  f"${envarname}/%s (if '{envarname}' environment variable is defined)",
+                  "$HOME/.local/share/wult/%s",
+                  "/usr/local/share/wult/%s", "/usr/share/wult/%s")
+
+    return ", ".join(dirname % subpath for dirname in searchdirs)
+
+@lru_cache(maxsize=None)
+def _get_deploy_spec(toolname, drivers, helpers, pyhelpers):
+    """
+    Build and return the 'deploy' command description for 'add_deploy_cmdline_args()'. This is pure
+    data, and it is cached, so it is built only once for the same arguments. The 'helpers' and
+    'pyhelpers' arguments must be tuples. Returns a dictionary with the following keys.
+      * help - the short 'deploy' command description.
+      * descr - the long 'deploy' command description.
+      * args - list of '(args, kwargs, dirs)' tuples, where 'args' and 'kwargs' are the
+               'add_argument()' arguments, and 'dirs' is 'True' if the argument is a directory path
+               (for the 'argcomplete' completer).
+    """
+
+    what = ""
+    if (helpers or pyhelpers) and drivers:
+        what = "helpers and drivers"
+    elif helpers or pyhelpers:
+        what = "helpers"
+    else:
+        what = "drivers"
+
+    spec = {"help" : f"Compile and deploy {toolname} {what}.", "args" : []}
+
+    descr = f"""Compile and deploy {toolname} {what} to the SUT (System Under Test), which can be
+                either local or a remote host, depending on the '-H' option."""
+    if drivers:
+        drvsearch = _get_searchdirs_descr(toolname, str(_DRV_SRC_SUBPATH))
+        descr += f"""The drivers are searched for in the following directories (and in the following
+                     order) on the local host: {drvsearch}."""
+    if helpers or pyhelpers:
+        helpersearch = _get_searchdirs_descr(toolname, str(_HELPERS_SRC_SUBPATH))
+        helpernames = ", ".join(helpers + pyhelpers)
+        descr += f"""The {toolname} tool also depends on the following helpers: {helpernames}. These
+                     helpers will be compiled on the SUT and deployed to the SUT. The sources of the
+                     helpers are searched for in the following paths (and in the following order) on
+                     the local host: {helpersearch}. By default, helpers are deployed to the path
+                     defined by the {toolname.upper()}_HELPERSPATH environment variable. If the
+                     variable is not defined, helpers are deployed to
+                     '$HOME/{_HELPERS_LOCAL_DIR}/bin', where '$HOME' is the home directory of user
+                     'USERNAME' on host 'HOST' (see '--host' and '--username' options)."""
+    spec["descr"] = descr
+
+    if drivers:
+        text = """Path to the Linux kernel sources to build the drivers against. The default is
+                  '/lib/modules/$(uname -r)/build' on the SUT. In case of deploying to a remote
+                  host, this is the path on the remote host (HOSTNAME)."""
+        kwargs = {"dest" : "ksrc", "type" : Path, "help" : text}
+        spec["args"].append((("--kernel-src",), kwargs, True))
+
+    return spec
+
 def add_deploy_cmdline_args(subparsers, toolname, func, drivers=True, helpers=None, pyhelpers=None,
                             argcomplete=None):
     """
@@ -62,46 +157,13 @@ def add_deploy_cmdline_args(subparsers, toolname, func, drivers=True, helpers=No
     if not pyhelpers:
         pyhelpers = []
 
-    what = ""
-    if (helpers or pyhelpers) and drivers:
-        what = "helpers and drivers"
-    elif helpers or pyhelpers:
-        what = "helpers"
-    else:
-        what = "drivers"
-
-    envarname = f"{toolname.upper()}_DATA_PATH"
-    searchdirs = [f"{Path(sys.argv[0]).parent}/%s",
-                  f"${envarname}/%s (if '{envarname}' environment variable is defined)",
-                  "$HOME/.local/share/wult/%s",
-                  "/usr/local/share/wult/%s", "/usr/share/wult/%s"]
+    spec = _get_deploy_spec(toolname, drivers, tuple(helpers), tuple(pyhelpers))
 
-    text = f"Compile and deploy {toolname} {what}."
-    descr = f"""Compile and deploy {toolname} {what} to the SUT (System Under Test), which can be
-                either local or a remote host, depending on the '-H' option."""
-    if drivers:
-        drvsearch = ", ".join([dirname % str(_DRV_SRC_SUBPATH) for dirname in searchdirs])
-        descr += f"""The drivers are searched for in the following directories (and in the following
-                     order) on the local host: {drvsearch}."""
-    if helpers or pyhelpers:
-        helpersearch = ", ".join([dirname % str(_HELPERS_SRC_SUBPATH) for dirname in searchdirs])
-        helpernames = ", ".join(helpers + pyhelpers)
-        descr += f"""The {toolname} tool also depends on the following helpers: {helpernames}. These
-                     helpers will be compiled on the SUT and deployed to the SUT. The sources of the
-                     helpers are searched for in the following paths (and in the following order) on
-                     the local host: {helpersearch}. By default, helpers are deployed to the path
-                     defined by the {toolname.upper()}_HELPERSPATH environment variable. If the
-                     variable is not defined, helpers are deployed to
-                     '$HOME/{_HELPERS_LOCAL_DIR}/bin', where '$HOME' is the home directory of user
-                     'USERNAME' on host 'HOST' (see '--host' and '--username' options)."""
-    parser = subparsers.add_parser("deploy", help=text, description=descr)
+    parser = subparsers.add_parser("deploy", help=spec["help"], description=spec["descr"])
 
-    if drivers:
-        text = """Path to the Linux kernel sources to build the drivers against. The default is
-                  '/lib/modules/$(uname -r)/build' on the SUT. In case of deploying to a remote
-                  host, this is the path on the remote host (HOSTNAME)."""
-        arg = parser.add_argument("--kernel-src", dest="ksrc", type=Path, help=text)
-        if argcomplete:
+    for args, kwargs, dirs in spec["args"]:
+        arg = parser.add_argument(*args, **kwargs)
+        if argcomplete and dirs:
             arg.completer = argcomplete.completers.DirectoriesCompleter()
 
     ArgParse.add_ssh_options(parser)
@@ -110,18 +172,28 @@ def add_deploy_cmdline_args(subparsers, toolname, func, drivers=True, helpers=No
     parser.set_defaults(helpers=helpers)
     parser.set_defaults(pyhelpers=pyhelpers)
 
-def _get_module_path(pman, name):
-    """Return path to installed module. Return 'None', if module not found."""
+def _get_module_paths(pman, names):
+    """
+    Return a '{name: path}' dictionary with paths to installed modules 'names'. The path is 'None'
+    if the module was not found. All the modules are looked up with a single command.
+    """
 
-    cmd = f"modinfo -n {name}"
-    stdout, _, exitcode = pman.run(cmd)
-    if exitcode != 0:
-        return None
+    if not names:
+        return {}
+
+    # Print one line per module: the module path, or an empty line if it was not found.
+    namesstr = " ".join(f"'{name}'" for name in names)
+    cmd = f"for name in {namesstr}; do " \
+          f"path=\"$(modinfo -n \"$name\" 2>/dev/null)\" && [ -f \"$path\" ] && " \
+          f"echo \"$path\" || echo; done"
+    stdout, _ = pman.run_verify(cmd, shell=True)
 
-    modpath = Path(stdout.strip())
-    if FSHelpers.isfile(modpath, pman):
-        return modpath
-    return None
+    lines = stdout.splitlines()
+    if len(lines) != len(names):
+        raise Error(f"unexpected output of the following command{pman.hostmsg}:\n{cmd}\n"
+                    f"Expected {len(names)} lines, got {len(lines)}:\n{stdout}")
+
+    return {name : Path(line) if line else None for name, line in zip(names, lines)}
 
 def get_helpers_deploy_path(pman, toolname):
     """
@@ -133,6 +205,55 @@ def get_helpers_deploy_path(pman, toolname):
         helpers_path = FSHelpers.get_homedir(pman=pman) / _HELPERS_LOCAL_DIR / "bin"
     return Path(helpers_path)
 
+def _parse_deployables(srcpath):
+    """
+    Parse the local 'Makefile' in the 'srcpath' directory and return the list of "deployables"
+    printed by its 'list_deployables' target. Returns 'None' if the 'Makefile' is not simple enough
+    to be parsed, in which case the caller should run 'make' instead.
+    """
+
+    try:
+        with open(Path(srcpath) / "Makefile", "r") as fobj:
+            lines = fobj.read().splitlines()
+    except OSError as err:
+        _LOG.debug("failed to read 'Makefile' in '%s': %s", srcpath, err)
+        return None
+
+    # The recipe is expected to be a single "@echo <deployables>" line.
+    try:
+        recipe = lines[lines.index("list_deployables:") + 1]
+    except (ValueError, IndexError):
+        return None
+
+    match = _ECHO_RECIPE_RE.match(recipe)
+    if not match:
+        return None
+
+    # Expand the simply-assigned variables, give up on anything else.
+    assignments = {}
+    for line in lines:
+        amatch = _MAKE_ASSIGN_RE.match(line)
+        if amatch:
+            assignments.setdefault(amatch.group("name"), []).append(amatch)
+
+    def expand(vmatch):
+        """Return the value of the make variable referenced by 'vmatch'."""
+
+        amatches = assignments.get(vmatch.group(1), [])
+        if len(amatches) != 1 or amatches[0].group("op") not in ("=", ":=") or \
+           "$" in amatches[0].group("value"):
+            raise ValueError
+        return amatches[0].group("value")
+
+    try:
+        deployables = _MAKE_VAR_RE.sub(expand, match.group(1))
+    except ValueError:
+        return None
+
+    if "$" in deployables:
+        return None
+    return deployables.split()
+
 def _get_deployables(srcpath, pman=None):
     """
     Returns the list of "deployables" (driver names or helper tool names) provided by tools or
@@ -142,11 +263,21 @@ def _get_deployables(srcpath, pman=None):
     if not pman:
         pman = LocalProcessManager.LocalProcessManager()
 
-    cmd = f"make --silent -C '{srcpath}' list_deployables"
-    deployables, _ = pman.run_verify(cmd)
-    if deployables:
-        deployables = Trivial.split_csv_line(deployables, sep=" ")
+    key = (str(srcpath), pman.hostname)
+    if key in _DEPLOYABLES_CACHE:
+        return _DEPLOYABLES_CACHE[key]
 
+    deployables = None
+    if not pman.is_remote:
+        deployables = _parse_deployables(srcpath)
+
+    if deployables is None:
+        cmd = f"make --silent -C '{srcpath}' list_deployables"
+        deployables, _ = pman.run_verify(cmd)
+        if deployables:
+            deployables = Trivial.split_csv_line(deployables, sep=" ")
+
+    _DEPLOYABLES_CACHE[key] = deployables
     return deployables
 
 def _get_pyhelper_dependencies(script_path):
@@ -161,6 +292,7 @@ def _get_pyhelper_dependencies(script_path):
     stdout, _ = LocalProcessManager.LocalProcessManager().run_verify(cmd)
     return [Path(path) for path in stdout.splitlines()]
 
+@lru_cache(maxsize=None)
 def find_app_data(prjname, subpath, appname=None, descr=None):
     """
     Search for application 'appname' data. The data are searched for in the 'subpath' sub-path of
@@ -172,7 +304,7 @@ def find_app_data(prjname, subpath, appname=None, descr=None):
       * /usr/share/<prjname>/, if it exists
 
     The 'descr' argument is a human-readable description of 'subpath', which will be used in the
-    error message if error is raised.
+    error message if error is raised. The found paths are cached.
     """
 
     if not appname:
@@ -213,19 +345,201 @@ def find_app_data(prjname, subpath, appname=None, descr=None):
     raise Error(f"cannot find {descr}, searched in the following directories on local host:\n"
                 f"{dirs}")
 
-def is_deploy_needed(pman, toolname, helpers=None, pyhelpers=None):
+def _get_mtimes(pman, paths):
+    """
+    Return a '{path: mtime}' dictionary with modification times of files in 'paths' on the host
+    defined by 'pman'. Files that do not exist are not included. On a remote host, all the files
+    are 'stat()'ed with a single command, instead of a command per file.
     """
-    Wult and other tools require additional helper programs and drivers to be installed on the SUT.
-    This function tries to analyze the SUT and figure out whether drivers and helper programs are
-    present and up-to-date. Returns 'True' if re-deployment is needed, and 'False' otherwise.
 
-    This function works by simply matching the modification date of sources and binaries for every
-    required helper and driver. If sources have later date, then re-deployment is probably needed.
-      * pman - the process manager object for the SUT.
-      * toolname - name of the tool to check the necessity of deployment for (e.g., "wult").
-      o helpers - list of helpers required to be deployed on the SUT.
-      o pyhelpers - list of python helpers required to be deployed on the SUT.
+    mtimes = {}
+    if not pman.is_remote:
+        for path in paths:
+            with contextlib.suppress(ErrorNotFound):
+                mtimes[path] = FSHelpers.get_mtime(path, pman)
+        return mtimes
+
+    if not paths:
+        return mtimes
+
+    # Note, 'stat' exits with code 1 if some of the files do not exist, but it still prints the rest
+    # of them. Any other failure (e.g., an SSH error) must not be mistaken for missing files.
+    pathsstr = " ".join(f"'{path}'" for path in paths)
+    cmd = f"stat -c '%Y %n' -- {pathsstr}"
+    stdout, stderr, exitcode = pman.run(cmd)
+
+    if exitcode != 0:
+        errlines = stderr.splitlines()
+        if exitcode != 1 or not errlines or \
+           not all("No such file or directory" in line for line in errlines):
+            raise Error(pman.cmd_failed_msg(cmd, stdout, stderr, exitcode))
+
+    for line in stdout.splitlines():
+        mtime, _, path = line.partition(" ")
+        if not Trivial.is_int(mtime) or not path:
+            raise Error(f"unexpected output of the following command{pman.hostmsg}:\n{cmd}\n"
+                        f"Got:\n{stdout}")
+        mtimes[Path(path)] = int(mtime)
+
+    return mtimes
+
+def _get_time_delta(pman):
+    """
+    Return the time shift in seconds between the local host and the SUT represented by 'pman'. The
+    result is cached for a short time, because checking it requires a round-trip to the SUT.
+    """
+
+    if not pman.is_remote:
+        return 0
+
+    now = time.time()
+    cached = _TIME_DELTA_CACHE.get(pman.hostname)
+    if cached and now - cached[0] < _TIME_DELTA_TTL:
+        return cached[1]
+
+    time_delta = time.time() - RemoteHelpers.time_time(pman=pman)
+    _TIME_DELTA_CACHE[pman.hostname] = (now, time_delta)
+    return time_delta
+
+def _get_kver(pman):
+    """
+    Return version of the kernel running on the SUT represented by 'pman'. The result is cached for
+    a short time, because checking it requires a round-trip to the SUT.
+    """
+
+    now = time.time()
+    cached = _KVER_CACHE.get(pman.hostname)
+    if cached and now - cached[0] < _KVER_TTL:
+        return cached[1]
+
+    kver = KernelVersion.get_kver(pman=pman)
+    _KVER_CACHE[pman.hostname] = (now, kver)
+    return kver
+
+def _get_newest_local_mtime(path):
+    """
+    Return the most recent modification time among files under local directory 'path' (or '0' if
+    there are no files). Symbolic links to directories are not followed.
+    """
+
+    mtime = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    mtime = max(mtime, _get_newest_local_mtime(entry.path))
+            else:
+                mtime = max(mtime, entry.stat().st_mtime)
+
+    return mtime
+
+def _get_deploy_state_path():
+    """Returns path to the local file caching the deployment state of the SUTs."""
+
+    cachedir = os.environ.get("XDG_CACHE_HOME")
+    if not cachedir:
+        cachedir = Path("~").expanduser() / ".cache"
+    return Path(cachedir) / "wult" / "deploy_state.json"
+
+def _load_deploy_state():
+    """Load and return the deployment state dictionary, return an empty dictionary on errors."""
+
+    path = _get_deploy_state_path()
+    try:
+        with open(path, "r") as fobj:
+            state = json.load(fobj)
+    except (OSError, ValueError) as err:
+        _LOG.debug("failed to load the deployment state from '%s': %s", path, err)
+        return {}
+
+    if not isinstance(state, dict):
+        return {}
+    return state
+
+def _write_deploy_state(state):
+    """Write the deployment state dictionary 'state' to the deployment state file."""
+
+    path = _get_deploy_state_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmppath = path.with_name(f"{path.name}.{os.getpid()}")
+        with open(tmppath, "w") as fobj:
+            json.dump(state, fobj)
+        os.replace(tmppath, path)
+    except OSError as err:
+        _LOG.debug("failed to save the deployment state to '%s': %s", path, err)
+
+def _deploy_state_matches(pman, toolname, kver, src_mtimes):
     """
+    Returns 'True' if the cached deployment state for tool 'toolname' on the SUT represented by
+    'pman' is recent enough, and was saved for the same SUT kernel version 'kver' and the same
+    sources modification times 'src_mtimes' ('{what: mtime}' dictionary, see 'is_deploy_needed()').
+    """
+
+    entry = _load_deploy_state().get(f"{pman.hostname}:{toolname}")
+    if not isinstance(entry, dict):
+        return False
+
+    if time.time() - entry.get("timestamp", 0) > _DEPLOY_STATE_TTL:
+        return False
+    return entry.get("kver") == kver and entry.get("src_mtimes") == src_mtimes
+
+def _save_deploy_state(pman, toolname, kver, src_mtimes):
+    """
+    Save the deployment state for tool 'toolname' on the SUT represented by 'pman': deployment is
+    not needed for SUT kernel version 'kver' and sources modification times 'src_mtimes'.
+    """
+
+    state = _load_deploy_state()
+    state[f"{pman.hostname}:{toolname}"] = {"timestamp" : time.time(), "kver" : kver,
+                                           "src_mtimes" : src_mtimes}
+    _write_deploy_state(state)
+
+def clear_deploy_state(pman, toolname):
+    """
+    Drop the cached deployment state for tool 'toolname' on the SUT represented by 'pman', so that
+    the next 'is_deploy_needed()' call checks the SUT. This should be called when loading the
+    drivers or starting the helpers fails, because they may be missing or broken on the SUT.
+    """
+
+    state = _load_deploy_state()
+    if state.pop(f"{pman.hostname}:{toolname}", None) is not None:
+        _write_deploy_state(state)
+
+def _get_deploy_info(pman, toolname, helpers=None, pyhelpers=None):
+    """
+    Build and return the deployment information dictionary for tool 'toolname' and the SUT
+    represented by 'pman'. The keys are "drivers" and the helper names, the values are dictionaries
+    with the following keys.
+      * src - list of local source paths.
+      * deployables - list of deployables built from the sources.
+      * src_mtime - the most recent modification time among the source files.
+    The arguments are the same as in 'is_deploy_needed()'.
+    """
+
+    def get_file_mtime(path):
+        """Return modification time of local file 'path'."""
+
+        if path not in mtimes:
+            mtimes[path] = path.stat().st_mtime
+        return mtimes[path]
+
+    def get_mtime(path):
+        """
+        Return modification time of local file 'path', or the most recent modification time among
+        files under 'path' in case it is a directory (or '0' for an empty directory). The results
+        are cached, because the python helpers share many dependencies, and every file or
+        directory should be scanned only once.
+        """
+
+        if path in mtimes:
+            return mtimes[path]
+        if not path.is_dir():
+            return get_file_mtime(path)
+
+        mtime = _get_newest_local_mtime(path)
+        mtimes[path] = mtime
+        return mtime
 
     def get_newest_mtime(paths):
         """
@@ -233,55 +547,26 @@ def is_deploy_needed(pman, toolname, helpers=None, pyhelpers=None):
         files in 'path' and (in case 'path' is irectory) every file under 'path'.
         """
 
-        newest = 0
-        for path in paths:
-            if not path.is_dir():
-                mtime = path.stat().st_mtime
-                if mtime > newest:
-                    newest = mtime
-            else:
-                for root, _, files in os.walk(path):
-                    for file in files:
-                        mtime = Path(root, file).stat().st_mtime
-                        if mtime > newest:
-                            newest = mtime
+        newest = max((get_mtime(path) for path in paths), default=0)
 
         if not newest:
             paths_str = "\n* ".join([str(path) for path in paths])
             raise Error(f"no files found in the following paths:\n{paths_str}")
         return newest
 
-    def deployable_not_found(what):
-        """Called when a helper of driver was not found on the SUT to raise an exception."""
-
-        err = f"{what} was not found on {pman.hostmsg}. Please, run:\n{toolname} deploy"
-        if pman.is_remote:
-            err += f" -H {pman.hostname}"
-        raise Error(err)
-
+    # Local files and directories modification time cache.
+    mtimes = {}
 
     # Build the deploy information dictionary. Start with drivers.
     dinfos = {}
     srcpath = find_app_data("wult", _DRV_SRC_SUBPATH / toolname, appname=toolname)
-    dstpaths = []
-    for deployable in _get_deployables(srcpath):
-        dstpath = _get_module_path(pman, deployable)
-        if not dstpath:
-            deployable_not_found(f"the '{deployable}' kernel module")
-        dstpaths.append(_get_module_path(pman, deployable))
-    dinfos["drivers"] = {"src" : [srcpath], "dst" : dstpaths}
+    dinfos["drivers"] = {"src" : [srcpath], "deployables" : _get_deployables(srcpath)}
 
     # Add non-python helpers' deploy information.
-    if helpers or pyhelpers:
-        helpers_deploy_path = get_helpers_deploy_path(pman, toolname)
-
     if helpers:
         for helper in helpers:
             srcpath = find_app_data("wult", _HELPERS_SRC_SUBPATH / helper, appname=toolname)
-            dstpaths = []
-            for deployable in _get_deployables(srcpath):
-                dstpaths.append(helpers_deploy_path / deployable)
-            dinfos[helper] = {"src" : [srcpath], "dst" : dstpaths}
+            dinfos[helper] = {"src" : [srcpath], "deployables" : _get_deployables(srcpath)}
 
     # Add python helpers' deploy information. Note, python helpers are deployed only to the remote
     # host. The local copy of python helpers comes via 'setup.py'. Therefore, check them only for
@@ -290,10 +575,10 @@ def is_deploy_needed(pman, toolname, helpers=None, pyhelpers=None):
         for pyhelper in pyhelpers:
             datapath = find_app_data("wult", _HELPERS_SRC_SUBPATH / pyhelper, appname=toolname)
             srcpaths = []
-            dstpaths = []
             lpman = LocalProcessManager.LocalProcessManager()
 
-            for deployable in _get_deployables(datapath, lpman):
+            deployables = _get_deployables(datapath, lpman)
+            for deployable in deployables:
                 if datapath.joinpath(deployable).exists():
                     # This case is relevant for running wult from sources - python helpers are
                     # in the 'helpers/pyhelper' directory.
@@ -304,31 +589,86 @@ def is_deploy_needed(pman, toolname, helpers=None, pyhelpers=None):
                     srcpath = FSHelpers.which(deployable).parent
 
                 srcpaths += _get_pyhelper_dependencies(srcpath / deployable)
-                dstpaths.append(helpers_deploy_path / deployable)
-            dinfos[pyhelper] = {"src" : srcpaths, "dst" : dstpaths}
+            dinfos[pyhelper] = {"src" : srcpaths, "deployables" : deployables}
+
+    for dinfo in dinfos.values():
+        dinfo["src_mtime"] = get_newest_mtime(dinfo["src"])
+
+    return dinfos
+
+def is_deploy_needed(pman, toolname, helpers=None, pyhelpers=None):
+    """
+    Wult and other tools require additional helper programs and drivers to be installed on the SUT.
+    This function tries to analyze the SUT and figure out whether drivers and helper programs are
+    present and up-to-date. Returns 'True' if re-deployment is needed, and 'False' otherwise.
 
-    # We are about to get timestamps for local and remote files. Take into account the possible time
-    # shift between local and remote systems.
-    time_delta = 0
-    if pman.is_remote:
-        time_delta = time.time() - RemoteHelpers.time_time(pman=pman)
+    This function works by simply matching the modification date of sources and binaries for every
+    required helper and driver. If sources have later date, then re-deployment is probably needed.
+      * pman - the process manager object for the SUT.
+      * toolname - name of the tool to check the necessity of deployment for (e.g., "wult").
+      o helpers - list of helpers required to be deployed on the SUT.
+      o pyhelpers - list of python helpers required to be deployed on the SUT.
+    """
+
+    def deployable_not_found(what):
+        """Called when a helper of driver was not found on the SUT to raise an exception."""
+
+        err = f"{what} was not found on {pman.hostmsg}. Please, run:\n{toolname} deploy"
+        if pman.is_remote:
+            err += f" -H {pman.hostname}"
+        raise Error(err)
+
+    # Note, the destination paths are added later, because they require talking to the SUT.
+    dinfos = _get_deploy_info(pman, toolname, helpers=helpers, pyhelpers=pyhelpers)
+
+    # If the sources have not changed since the last check, which found that deployment is not
+    # needed, do not bother the SUT.
+    src_mtimes = {what : dinfo["src_mtime"] for what, dinfo in dinfos.items()}
+    # The drivers are installed for a specific kernel, so the SUT may need a deployment after it
+    # booted a different kernel.
+    kver = _get_kver(pman)
+    if _deploy_state_matches(pman, toolname, kver, src_mtimes):
+        _LOG.debug("deployment is not needed%s according to the cached deployment state",
+                   pman.hostmsg)
+        return False
+
+    # Add the destination paths.
+    modpaths = _get_module_paths(pman, dinfos["drivers"]["deployables"])
+    dstpaths = []
+    for deployable in dinfos["drivers"]["deployables"]:
+        dstpath = modpaths[deployable]
+        if not dstpath:
+            deployable_not_found(f"the '{deployable}' kernel module")
+        dstpaths.append(dstpath)
+    dinfos["drivers"]["dst"] = dstpaths
+
+    if len(dinfos) > 1:
+        helpers_deploy_path = get_helpers_deploy_path(pman, toolname)
+        for what, dinfo in dinfos.items():
+            if what != "drivers":
+                dinfo["dst"] = [helpers_deploy_path / name for name in dinfo["deployables"]]
+
+    # Get modification times of all the destination files at once.
+    dst_mtimes = _get_mtimes(pman, [dst for dinfo in dinfos.values() for dst in dinfo["dst"]])
 
     # Compare source and destination files' timestamps.
     for what, dinfo in dinfos.items():
         src = dinfo["src"]
-        src_mtime = get_newest_mtime(src)
+        src_mtime = dinfo["src_mtime"]
         for dst in dinfo["dst"]:
-            try:
-                dst_mtime = FSHelpers.get_mtime(dst, pman)
-            except ErrorNotFound:
+            dst_mtime = dst_mtimes.get(dst)
+            if dst_mtime is None:
                 deployable_not_found(dst)
 
+            # Take into account the possible time shift between local and remote systems.
+            time_delta = _get_time_delta(pman)
             if src_mtime > time_delta + dst_mtime:
                 src_str = ", ".join([str(path) for path in src])
                 _LOG.debug("%s src time %d + %d > dst_mtime %d\nsrc: %s\ndst %s",
                            what, src_mtime, time_delta, dst_mtime, src_str, dst)
                 return True
 
+    _save_deploy_state(pman, toolname, kver, src_mtimes)
     return False
 
 def _log_cmd_output(args, stdout, stderr):
@@ -341,7 +681,10 @@ def _log_cmd_output(args, stdout, stderr):
             _LOG.log(Logging.ERRINFO, stderr)
 
 def _deploy_drivers(args, pman):
-    """Deploy drivers to the SUT represented by 'pman'."""
+    """
+    Deploy drivers to the SUT represented by 'pman'. Returns version of the kernel the drivers were
+    deployed for.
+    """
 
     drvsrc = find_app_data("wult", _DRV_SRC_SUBPATH/f"{args.toolname}",
                            descr=f"{args.toolname} drivers sources")
@@ -350,9 +693,8 @@ def _deploy_drivers(args, pman):
 
     kver = None
     if not args.ksrc:
-        kver = KernelVersion.get_kver(pman=pman)
-        if not args.ksrc:
-            args.ksrc = Path(f"/lib/modules/{kver}/build")
+        kver = args.kver
+        args.ksrc = Path(f"/lib/modules/{kver}/build")
     else:
         args.ksrc = FSHelpers.abspath(args.ksrc, pman=pman)
 
@@ -379,7 +721,7 @@ def _deploy_drivers(args, pman):
 
     # Build the drivers on the SUT.
     _LOG.info("Compiling the drivers%s", pman.hostmsg)
-    cmd = f"make -C '{drvsrc}' KSRC='{args.ksrc}'"
+    cmd = f"make -j{args.jobs} -C '{drvsrc}' KSRC='{args.ksrc}'"
     if args.debug:
         cmd += " V=1"
 
@@ -397,24 +739,38 @@ def _deploy_drivers(args, pman):
     dstdir = kmodpath / _DRV_SRC_SUBPATH
     FSHelpers.mkdir(dstdir, parents=True, exist_ok=True, pman=pman)
 
-    for name in _get_deployables(drvsrc, pman):
-        installed_module = _get_module_path(pman, name)
-        srcpath = drvsrc / f"{name}.ko"
+    deployables = _get_deployables(drvsrc, pman)
+    installed_modules = _get_module_paths(pman, deployables)
+    srcpaths = []
+    old_modules = []
+    for name in deployables:
+        installed_module = installed_modules[name]
+        srcpaths.append(drvsrc / f"{name}.ko")
         dstpath = dstdir / f"{name}.ko"
         _LOG.info("Deploying driver '%s' to '%s'%s", name, dstpath, pman.hostmsg)
-        pman.rsync(srcpath, dstpath, remotesrc=True, remotedst=True)
 
         if installed_module and installed_module.resolve() != dstpath.resolve():
             _LOG.debug("removing old module '%s'%s", installed_module, pman.hostmsg)
-            pman.run_verify(f"rm -f '{installed_module}'")
+            old_modules.append(installed_module)
+
+    # Copy all the modules with a single 'rsync' command, the sources and the destination are both
+    # on the SUT.
+    if srcpaths:
+        srcpathsstr = " ".join(f"'{srcpath}'" for srcpath in srcpaths)
+        pman.run_verify(f"rsync -rlpD -- {srcpathsstr} '{dstdir}/'")
+    if old_modules:
+        pman.run_verify("rm -f -- " + " ".join(f"'{path}'" for path in old_modules))
 
     stdout, stderr = pman.run_verify(f"depmod -a -- '{kver}'")
     _log_cmd_output(args, stdout, stderr)
 
     # Potentially the deployed driver may crash the system before it gets to write-back data
     # to the file-system (e.g., what 'depmod' modified). This may lead to subsequent boot
-    # problems. So sync the file-system now.
-    pman.run_verify("sync")
+    # problems. So sync the file-system now. Sync only the file-system containing the kernel modules
+    # and fall back to syncing all file-systems if 'sync' does not support the '-f' option.
+    pman.run_verify(f"sync -f -- '{kmodpath}' 2>/dev/null || sync", shell=True)
+
+    return kver
 
 def _create_standalone_python_script(script, pyhelperdir):
     """
@@ -556,19 +912,14 @@ def _deploy_helpers(args, pman):
         for name in deployables:
             _create_standalone_python_script(name, basedir)
 
-    # And copy the "standoline-ized" version of python helpers to the SUT.
-    if pman.is_remote:
-        for pyhelper in args.pyhelpers:
-            srcdir = args.ctmpdir / pyhelper
-            _LOG.debug("copying helper '%s' to %s:\n  '%s' -> '%s'",
-                       pyhelper, pman.hostname, srcdir, args.stmpdir)
-            pman.rsync(f"{srcdir}", args.stmpdir, remotesrc=False, remotedst=True)
-
-    # Copy non-python helpers to the temporary directory on the SUT.
-    for helper in args.helpers:
-        srcdir = helpersrc/ helper
+    # Copy the "standoline-ized" version of python helpers and the non-python helpers to the
+    # temporary directory on the SUT.
+    srcdirs = [args.ctmpdir / pyhelper for pyhelper in args.pyhelpers]
+    srcdirs += [helpersrc / helper for helper in args.helpers]
+
+    for srcdir in srcdirs:
         _LOG.debug("copying helper '%s' to %s:\n  '%s' -> '%s'",
-                   helper, pman.hostname, srcdir, args.stmpdir)
+                   srcdir.name, pman.hostname, srcdir, args.stmpdir)
         pman.rsync(f"{srcdir}", args.stmpdir, remotesrc=False, remotedst=True)
 
     deploy_path = get_helpers_deploy_path(pman, args.toolname)
@@ -578,7 +929,7 @@ def _deploy_helpers(args, pman):
         for helper in args.helpers:
             _LOG.info("Compiling helper '%s'%s", helper, pman.hostmsg)
             helperpath = f"{args.stmpdir}/{helper}"
-            stdout, stderr = pman.run_verify(f"make -C '{helperpath}'")
+            stdout, stderr = pman.run_verify(f"make -j{args.jobs} -C '{helperpath}'")
             _log_cmd_output(args, stdout, stderr)
 
     # Make sure the the destination deployment directory exists.
@@ -597,7 +948,56 @@ def _deploy_helpers(args, pman):
         stdout, stderr = pman.run_verify(cmd)
         _log_cmd_output(args, stdout, stderr)
 
-        pman.rsync(str(helpersdst) + "/bin/", deploy_path, remotesrc=True, remotedst=True)
+    pman.rsync(str(helpersdst) + "/bin/", deploy_path, remotesrc=True, remotedst=True)
+
+def _probe_sut(pman, toolname, mktemp):
+    """
+    Collect the information about the SUT represented by 'pman' that is required for deployment.
+    Everything is collected with a single command in order to save round-trips to remote SUTs.
+    Returns a dictionary with the following keys.
+      * make - 'True' if the 'make' tool is installed on the SUT, 'False' otherwise.
+      * cpus - count of CPUs on the SUT (used for the count of parallel 'make' jobs), 1 if the
+               CPUs count cannot be figured out.
+      * kver - version of the kernel running on the SUT.
+      * tmpdir - path to a new temporary directory on the SUT if 'mktemp' is 'True', otherwise
+                 'None'.
+    """
+
+    cmds = ["command -v make >/dev/null 2>&1 && echo 1 || echo 0",
+            "nproc 2>/dev/null || echo 1",
+            "uname -r"]
+    if mktemp:
+        cmds.append(f"mktemp -d -t '{toolname}-XXXXXX'")
+
+    cmd = "; ".join(cmds)
+    stdout, stderr = pman.run_verify(cmd, shell=True)
+
+    lines = [line.strip() for line in stdout.splitlines()]
+    if len(lines) < len(cmds) or not all(lines):
+        # Some of the commands (e.g., 'mktemp') failed without printing anything.
+        if stdout.strip():
+            got = f"got:\n{stdout}"
+        else:
+            got = "got no output"
+        msg = f"failed to probe the SUT{pman.hostmsg}: expected {len(cmds)} non-empty lines of " \
+              f"output from the following command:\n{cmd}\n{got}"
+        if stderr:
+            msg += f"\nThe error output was:\n{stderr}"
+        raise Error(msg)
+    if len(lines) != len(cmds):
+        raise Error(f"unexpected output of the following command{pman.hostmsg}:\n{cmd}\n"
+                    f"Expected {len(cmds)} lines, got:\n{stdout}")
+
+    info = {"make" : lines[0] == "1", "cpus" : 1, "kver" : lines[2], "tmpdir" : None}
+    if Trivial.is_int(lines[1]):
+        info["cpus"] = max(int(lines[1]), 1)
+    else:
+        _LOG.debug("failed to get CPUs count%s, using 1 'make' job", pman.hostmsg)
+    if mktemp:
+        info["tmpdir"] = Path(lines[3])
+
+    _KVER_CACHE[pman.hostname] = (time.time(), info["kver"])
+    return info
 
 def _remove_deploy_tmpdir(args, pman, success=True):
     """Remove temporary files."""
@@ -642,20 +1042,41 @@ def deploy_command(args):
         args.ctmpdir = FSHelpers.mktemp(prefix=f"{args.toolname}-")
 
     with contextlib.closing(ToolsCommon.get_pman(args)) as pman:
-        if not FSHelpers.which("make", default=None, pman=pman):
+        mktemp = pman.is_remote or not args.ctmpdir
+        sutinfo = _probe_sut(pman, args.toolname, mktemp)
+
+        if not sutinfo["make"]:
+            if sutinfo["tmpdir"]:
+                FSHelpers.rm_minus_rf(sutinfo["tmpdir"], pman=pman)
             raise Error(f"please, install the 'make' tool{pman.hostmsg}")
 
-        if pman.is_remote or not args.ctmpdir:
-            args.stmpdir = FSHelpers.mktemp(prefix=f"{args.toolname}-", pman=pman)
+        args.jobs = sutinfo["cpus"]
+        args.kver = sutinfo["kver"]
+
+        if mktemp:
+            args.stmpdir = sutinfo["tmpdir"]
         else:
             args.stmpdir = args.ctmpdir
 
         success = True
         try:
-            _deploy_drivers(args, pman)
+            drvkver = _deploy_drivers(args, pman)
             _deploy_helpers(args, pman)
         except:
             success = False
+            # Whatever was deployed before the failure should not be trusted.
+            clear_deploy_state(pman, args.toolname)
             raise
         finally:
             _remove_deploy_tmpdir(args, pman, success=success)
+
+        # Everything has just been deployed, so the following 'is_deploy_needed()' calls do not
+        # have to check the SUT. Unless the drivers were built for a kernel other than the running
+        # one (see '--kernel-src').
+        if drvkver == sutinfo["kver"]:
+            dinfos = _get_deploy_info(pman, args.toolname, helpers=args.helpers,
+                                      pyhelpers=args.pyhelpers)
+            src_mtimes = {what : dinfo["src_mtime"] for what, dinfo in dinfos.items()}
+            _save_deploy_state(pman, args.toolname, drvkver, src_mtimes)
+        else:
+            clear_deploy_state(pman, args.toolname)
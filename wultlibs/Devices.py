@@ -14,6 +14,9 @@ This module provides an abstraction for a device that can be used as a source of
 compatible wult devices.
 """
 
+import re
+import time
+import weakref
 import contextlib
 import logging
 from pathlib import Path
@@ -21,14 +24,163 @@ from pepclibs.helperlibs import FSHelpers, Dmesg
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound, ErrorNotSupported
 from wultlibs import NetIface, LsPCI
 
-# All the possible wult device driver names.
-DRVNAMES = set()
-
 # All supported device types.
 DEVTYPES = ("i210", "tdt", "hrtimer")
 
+# How long (in seconds) the PCI devices and network interfaces information stays in the caches.
+_CACHE_TTL = 5
+
+# The PCI devices and network interfaces information caches, shared by 'scan_devices()' and the
+# device objects. Indexed by the process manager object, values are '(timestamp, info)' tuples,
+# where 'info' is the 'LsPCI' devices list or the hardware address to network interface name map.
+# The entries go away together with the process manager objects. The cached values must not refer
+# to the process manager object, otherwise it would never go away.
+_PCI_DEVICES_CACHE = weakref.WeakKeyDictionary()
+_IFMAP_CACHE = weakref.WeakKeyDictionary()
+
+# The PCI device binding method that worked last time for a driver and PCI ID. Indexed by
+# '(drvname, vendorid, devid)' tuples, the values are "new_id" or "bind".
+_BIND_METHODS = {}
+
+# The regular expression matching full PCI addresses, such as '0000:04:00.0'.
+_PCI_ADDR_RE = re.compile(r"^[0-9a-fA-F]{4}:[0-9a-fA-F]{2}:[0-9a-fA-F]{2}\.[0-7]$")
+
+# The regular expression matching strings that may be network interface names or hardware
+# addresses (see 'NetIface.NetIface()'): a single path component without white-spaces.
+_IFID_RE = re.compile(r"^(?!\.{1,2}$)[^\s/]+$")
+
+# The PCI device description template. The 'base' field is the short device description, the rest
+# of the fields come from the 'LsPCI' device information dictionary.
+_PCI_DESCR_TMPL = "{base}. PCI address {pciaddr}, Vendor ID {vendorid}, Device ID {devid}."
+
+# The sysfs directories for PCI devices and drivers.
+_PCI_DEVICES_PATH = Path("/sys/bus/pci/devices")
+_PCI_DRIVERS_PATH = Path("/sys/bus/pci/drivers")
+
+# The sysfs directory for network interfaces.
+_NET_SYSFS_PATH = "/sys/class/net"
+
+# The line prefix marking the beginning of a new path in the '_bulk_read()' command output.
+_BULK_MARKER = "--wult-path:"
+
+# Path template of the sysfs file holding name of the clockevent device used by a CPU.
+_CLKEVT_PATH_TMPL = "/sys/devices/system/clockevents/clockevent{}/current_device"
+
+# The per-CPU clockevent device names cache. Indexed by the process manager object, values are
+# '{cpunum: clkname}' dictionaries. The clockevent devices do not change at run-time, and the cache
+# entries go away together with the process manager objects.
+_CLKNAME_CACHE = weakref.WeakKeyDictionary()
+
 _LOG = logging.getLogger()
 
+def _cache_get(cache, pman):
+    """Return the 'pman' entry of the 'cache' cache, or 'None' if it is not there or stale."""
+
+    if pman in cache:
+        timestamp, info = cache[pman]
+        if time.time() - timestamp < _CACHE_TTL:
+            return info
+    return None
+
+def _get_lspci(pman):
+    """
+    Return an 'LsPCI' object for the host defined by 'pman'. The PCI devices information is cached
+    for '_CACHE_TTL' seconds, so that scanning the devices and creating the device objects right
+    after that does not enumerate the PCI devices more than once.
+    """
+
+    devices = _cache_get(_PCI_DEVICES_CACHE, pman)
+    lspci = LsPCI.LsPCI(pman, devices=devices)
+    if devices is None:
+        _PCI_DEVICES_CACHE[pman] = (time.time(), list(lspci.get_devices()))
+    return lspci
+
+def _get_ifmap(pman):
+    """
+    Return the hardware address to network interface name map for the host defined by 'pman' (see
+    'NetIface.get_hwaddr_to_ifname_map()'). The map is cached for '_CACHE_TTL' seconds.
+    """
+
+    ifmap = _cache_get(_IFMAP_CACHE, pman)
+    if ifmap is None:
+        ifmap = NetIface.get_hwaddr_to_ifname_map(pman=pman)
+        _IFMAP_CACHE[pman] = (time.time(), ifmap)
+    return ifmap
+
+def _try_abspath(path, pman):
+    """
+    Resolve 'path' to the absolute real path on the host defined by 'pman'. Returns 'None' if
+    'path' does not exist. This is a single operation, as opposed to the 'FSHelpers.exists()' +
+    'FSHelpers.abspath()' combination, which costs 2 round-trips on remote hosts.
+    """
+
+    try:
+        return FSHelpers.abspath(path, pman=pman)
+    except Error:
+        return None
+
+def _bulk_read(pman, paths=(), links=()):
+    """
+    Read multiple sysfs files and resolve multiple symlinks on the host defined by 'pman' using a
+    single command, which is a single round-trip in case of a remote host. The arguments are as
+    follows.
+      * paths - paths of the files to read.
+      * links - paths of the symlinks to resolve.
+
+    The paths may include shell wildcards. Returns a dictionary indexed by the paths that exist
+    (with the wildcards expanded). The values are the file contents (stripped) for 'paths' elements
+    and the resolved paths for 'links' elements.
+    """
+
+    cmds = []
+    for tool, pths in (("cat", paths), ("readlink -f", links)):
+        if pths:
+            pths = " ".join(str(path) for path in pths)
+            cmds.append(f"for p in {pths}; do if [ -e \"$p\" ]; then "
+                        f"echo \"{_BULK_MARKER}$p\"; {tool} -- \"$p\" 2>/dev/null; fi; done")
+    if not cmds:
+        return {}
+
+    cmds.append("true")
+    stdout, _ = pman.run_verify("; ".join(cmds), shell=True)
+
+    result = {}
+    path = None
+    for line in stdout.splitlines():
+        if line.startswith(_BULK_MARKER):
+            path = line[len(_BULK_MARKER):]
+            result[path] = []
+        elif path:
+            result[path].append(line)
+
+    return {path : "\n".join(lines).strip() for path, lines in result.items()}
+
+def _prefetch_sysfs(pman, devtypes):
+    """
+    Read all the sysfs information 'scan_devices()' needs for device types in 'devtypes' with a
+    single '_bulk_read()', and put it to the clockevent names and network interfaces caches.
+    """
+
+    paths = []
+    if "tdt" in devtypes:
+        paths.append(_CLKEVT_PATH_TMPL.format(0))
+    links = []
+    if "i210" in devtypes:
+        links.append(f"{_NET_SYSFS_PATH}/*/device")
+
+    info = _bulk_read(pman, paths=paths, links=links)
+
+    for path in paths:
+        if path in info:
+            _CLKNAME_CACHE.setdefault(pman, {})[0] = info[path]
+
+    if links:
+        ifmap = {}
+        for path, devpath in info.items():
+            if path.startswith(f"{_NET_SYSFS_PATH}/") and devpath:
+                ifmap[Path(devpath).name] = Path(path).parent.name
+        _IFMAP_CACHE[pman] = (time.time(), ifmap)
+
 class _WultDeviceBase:
     """
     This is the base class for wult delayed event devices. It has 2 purposes.
@@ -36,6 +188,8 @@ class _WultDeviceBase:
        * Define the API that subclasses (particular device types) have to implement.
     """
 
+    __slots__ = ("_devid", "_cpunum", "_pman", "_dmesg", "_dmesg_obj", "info")
+
     # Name of wult driver that handles this device.
     drvname = None
 
@@ -49,13 +203,32 @@ class _WultDeviceBase:
         """
         return None
 
+    def _get_dmesg_obj(self):
+        """
+        Return the 'Dmesg' object for the 'dmesg' output checks, or 'None' if the checks are
+        disabled. The object is created and the initial 'dmesg' snapshot is taken on the first call,
+        so devices which never need it (e.g., the short-living ones) do not run 'dmesg' at all.
+        """
+
+        if not self._dmesg_obj and self._dmesg and getattr(self, "_pman", None):
+            self._dmesg_obj = Dmesg.Dmesg(pman=self._pman)
+            self._dmesg_obj.run(capture=True)
+
+        return self._dmesg_obj
+
+    @property
+    def dmesg_obj(self):
+        """The 'Dmesg' object for the 'dmesg' output checks (see '_get_dmesg_obj()')."""
+        return self._get_dmesg_obj()
+
     def get_new_dmesg(self):
         """
         Return new dmesg messages as a single string, if available."""
 
-        if not self.dmesg_obj:
+        dmesg_obj = self._get_dmesg_obj()
+        if not dmesg_obj:
             return ""
-        new_msgs = self.dmesg_obj.get_new_messages(join=True)
+        new_msgs = dmesg_obj.get_new_messages(join=True)
         if new_msgs:
             return f"New kernel messages{self._pman.hostmsg}:\n{new_msgs}"
         return ""
@@ -78,11 +251,8 @@ class _WultDeviceBase:
         self._devid = devid
         self._cpunum = cpunum
         self._pman = pman
-        self.dmesg_obj = None
-
-        if dmesg:
-            self.dmesg_obj = Dmesg.Dmesg(pman=self._pman)
-            self.dmesg_obj.run(capture=True)
+        self._dmesg = dmesg
+        self._dmesg_obj = None
 
         # Device information dictionary. Every subclass is expected to provide the following keys.
         # * name - device name (string). Should be short (1-2 words), preferably human-readable.
@@ -100,9 +270,9 @@ class _WultDeviceBase:
         """Uninitialize the device."""
         if getattr(self, "_pman", None):
             self._pman = None
-        if getattr(self, "dmesg_obj", None):
-            self.dmesg_obj.close()
-            self.dmesg_obj = None
+        if getattr(self, "_dmesg_obj", None):
+            self._dmesg_obj.close()
+            self._dmesg_obj = None
 
     def __enter__(self):
         """Enter the run-time context."""
@@ -112,15 +282,11 @@ class _WultDeviceBase:
         """Exit the runtime context."""
         self.close()
 
-    def __init_subclass__(cls, **_):
-        """Populate the device driver names collection ('DRVNAMES')."""
-        if cls.drvname:
-            DRVNAMES.add(cls.drvname)
-
-
 class _PCIDevice(_WultDeviceBase):
     """This class represents a PCI device that can be used for as a source of delayed events."""
 
+    __slots__ = ("_pci_info", "_devpath", "_driver_link")
+
     # Subclasses can define this dictionary to limit list of supported PCI devices.
     supported_devices = {}
 
@@ -132,13 +298,11 @@ class _PCIDevice(_WultDeviceBase):
          * driver sysfs path
         """
 
-        drvpath = Path(f"{self._devpath}/driver")
-        if not FSHelpers.exists(drvpath, pman=self._pman):
+        drvpath = _try_abspath(self._driver_link, self._pman)
+        if not drvpath:
             return (None, None)
 
-        drvpath = FSHelpers.abspath(drvpath, pman=self._pman)
-        drvname = Path(drvpath).name
-        return (drvname, drvpath)
+        return (drvpath.name, drvpath)
 
     def get_driver_name(self):
         """
@@ -154,12 +318,13 @@ class _PCIDevice(_WultDeviceBase):
         _LOG.debug("binding device '%s' to driver '%s'%s",
                    self._pci_info["pciaddr"], drvname, self._pman.hostmsg)
 
+        # Make sure the initial 'dmesg' snapshot is taken before the device state changes.
+        self._get_dmesg_obj()
+
         failmsg = f"failed to bind device '{self._pci_info['pciaddr']}' to driver '{drvname}'" \
                   f"{self._pman.hostmsg}"
 
-        drvpath = Path(f"/sys/bus/pci/drivers/{drvname}")
-        if not FSHelpers.exists(drvpath, pman=self._pman):
-            raise Error(f"{failmsg}':\npath '{drvpath}' does not exist{self._pman.hostmsg}")
+        drvpath = _PCI_DRIVERS_PATH / drvname
 
         cur_drvname = self.get_driver_name()
         if cur_drvname == drvname:
@@ -170,31 +335,34 @@ class _PCIDevice(_WultDeviceBase):
         if cur_drvname:
             raise Error(f"{failmsg}:\nit is already bound to driver '{cur_drvname}'")
 
-        # At this point we do not know if the driver supports this PCI ID. So start with the
-        # assumption that it does not, in which case writing to the 'new_id' file should do both:
-        # * make the driver aware of the PCI ID
-        # * bind the device
-        path = f"{drvpath}/new_id"
-        val = f"{self._pci_info['vendorid']} {self._pci_info['devid']}"
-        bound = True
-
-        try:
-            with self._pman.open(path, "wt") as fobj:
-                _LOG.debug("writing '%s' to file '%s'", val, path)
-                fobj.write(val)
-        except Error as err:
-            bound = False
-
-        if not bound:
-            # Probably the driver already knows about this PCI ID. Use the 'bind' file in this case.
-            path = f"{drvpath}/bind"
-            val = self._pci_info["pciaddr"]
-            with self._pman.open(path, "wt") as fobj:
-                _LOG.debug("writing '%s' to file '%s'", val, path)
-                try:
+        # There are 2 ways to bind the device:
+        # * write the PCI ID to the 'new_id' file, which makes the driver aware of the PCI ID and
+        #   binds the device.
+        # * write the PCI address to the 'bind' file, which works only if the driver already knows
+        #   about the PCI ID.
+        # Unless we already know which way works for this driver and PCI ID, we do not know if the
+        # driver supports this PCI ID. So start with the assumption that it does not. If the driver
+        # does not exist, writing to both files fails, so there is no need to check for the driver
+        # sysfs directory beforehand.
+        vendorid, pci_id = self._pci_info["vendorid"], self._pci_info["devid"]
+        key = (drvname, vendorid, pci_id)
+        methods = [("new_id", f"{vendorid} {pci_id}"), ("bind", self._pci_info["pciaddr"])]
+        if _BIND_METHODS.get(key) == "bind":
+            methods.reverse()
+
+        for idx, (method, val) in enumerate(methods):
+            path = drvpath / method
+            try:
+                with self._pman.open(path, "wt") as fobj:
+                    _LOG.debug("writing '%s' to file '%s'", val, path)
                     fobj.write(val)
-                except Error as err:
+            except Error as err:
+                if idx == len(methods) - 1:
                     raise Error(f"{failmsg}:\n{err}\n{self.get_new_dmesg()}") from err
+                continue
+
+            _BIND_METHODS[key] = method
+            break
 
         # Verify that the device is bound to the driver.
         if not self._get_driver()[1]:
@@ -216,14 +384,18 @@ class _PCIDevice(_WultDeviceBase):
                        self._pci_info["pciaddr"], self._pman.hostmsg)
             return drvname
 
+        # Make sure the initial 'dmesg' snapshot is taken before the device state changes.
+        self._get_dmesg_obj()
+
         _LOG.debug("unbinding device '%s' from driver '%s'%s",
                    self._pci_info["pciaddr"], drvname, self._pman.hostmsg)
 
         failmsg = f"failed to unbind PCI device '{self._pci_info['pciaddr']}' from driver " \
                   f"'{drvname}'{self._pman.hostmsg}"
 
-        with self._pman.open(drvpath / "unbind", "wt") as fobj:
-            _LOG.debug("writing '%s' to '%s'", self._pci_info["pciaddr"], drvpath / "unbind")
+        path = drvpath / "unbind"
+        with self._pman.open(path, "wt") as fobj:
+            _LOG.debug("writing '%s' to '%s'", self._pci_info["pciaddr"], path)
             try:
                 fobj.write(self._pci_info["pciaddr"])
             except Error as err:
@@ -244,14 +416,32 @@ class _PCIDevice(_WultDeviceBase):
 
         self._pci_info = None
         self._devpath = None
+        self._driver_link = None
+
+        # Look the device up in the enumerated PCI devices list first. If it is there, the device
+        # exists and there is no need to check for it in sysfs. The devices list is cached and shared
+        # with 'scan_devices()'.
+        lspci = _get_lspci(pman)
+        pci_info = None
+        for info in lspci.get_devices():
+            if info["pciaddr"] == devid:
+                pci_info = info
+                break
+
+        if pci_info:
+            self._pci_info = pci_info
+            self._devpath = _PCI_DEVICES_PATH / pci_info["pciaddr"]
+        else:
+            path = _PCI_DEVICES_PATH / self._devid
+            self._devpath = _try_abspath(path, self._pman)
+            if not self._devpath:
+                raise ErrorNotFound(f"cannot find device '{self._devid}'{self._pman.hostmsg}:\n"
+                                    f"path {path} does not exist")
 
-        path = Path(f"/sys/bus/pci/devices/{self._devid}")
-        if not FSHelpers.exists(path, pman=pman):
-            raise ErrorNotFound(f"cannot find device '{self._devid}'{self._pman.hostmsg}:\n"
-                                f"path {path} does not exist")
+            self._devpath = Path(self._devpath)
+            self._pci_info = lspci.get_info(self._devpath.name)
 
-        self._devpath = FSHelpers.abspath(path, pman=self._pman)
-        self._pci_info = LsPCI.LsPCI(pman).get_info(Path(self._devpath).name)
+        self._driver_link = self._devpath / "driver"
 
         if self.supported_devices and self._pci_info["devid"] not in self.supported_devices:
             supported = ["%s - %s" % (key, val) for key, val in self.supported_devices.items()]
@@ -264,13 +454,12 @@ class _PCIDevice(_WultDeviceBase):
         self.info["name"] = "Intel I210"
         self.info["devid"] = self._pci_info["pciaddr"]
         if self.supported_devices:
-            self.info["descr"] = self.supported_devices[self._pci_info["devid"]]
+            base = self.supported_devices[self._pci_info["devid"]]
         else:
             self.info["name"] = self._pci_info["name"]
-            self.info["descr"] = self.info['name'].capitalize()
+            base = self.info['name'].capitalize()
 
-        self.info["descr"] += f". PCI address {self._pci_info['pciaddr']}, Vendor ID " \
-                              f"{self._pci_info['vendorid']}, Device ID {self._pci_info['devid']}."
+        self.info["descr"] = _PCI_DESCR_TMPL.format_map({**self._pci_info, "base" : base})
         self.info["aspm_enabled"] = self._pci_info["aspm_enabled"]
 
 class _IntelI210(_PCIDevice):
@@ -278,6 +467,8 @@ class _IntelI210(_PCIDevice):
     This class extends the '_PCIDevice' class with 'Intel I210' NIC support.
     """
 
+    __slots__ = ()
+
     drvname = "wult_igb"
     supported_devices = {
         '1533' : 'Intel I210 (copper)',
@@ -297,10 +488,18 @@ class _IntelI210(_PCIDevice):
         """
 
         netif = None
-        try:
-            netif = NetIface.NetIface(devid, pman=pman)
-        except ErrorNotFound:
-            pass
+        if _PCI_ADDR_RE.match(devid):
+            # 'devid' is a PCI address. Create the network interface object only if there is a
+            # network interface for this device. The interfaces map is cached and shared with
+            # 'scan_devices()'.
+            ifname = _get_ifmap(pman).get(devid)
+            if ifname:
+                netif = NetIface.NetIface(ifname, pman=pman)
+        else:
+            try:
+                netif = NetIface.NetIface(devid, pman=pman)
+            except ErrorNotFound:
+                pass
 
         if netif:
             # Make sure the device is not used for networking, because we are about to unbind it
@@ -327,29 +526,66 @@ class _TSCDeadlineTimer(_WultDeviceBase):
     certain value. Wult can use this as a source of delayed events.
     """
 
+    __slots__ = ()
+
     drvname = "wult_tdt"
     supported_devices = {"tdt" : "TSC deadline timer"}
-    alias = "tsc-deadline-timer"
+    aliases = frozenset({"tsc-deadline-timer"})
+
+    @staticmethod
+    def _get_clkname(pman, cpunum):
+        """
+        Return name of the clockevent device used by CPU 'cpunum' on the host defined by 'pman'.
+        """
+
+        clknames = _CLKNAME_CACHE.setdefault(pman, {})
+        if cpunum not in clknames:
+            path = Path(_CLKEVT_PATH_TMPL.format(cpunum))
+            with pman.open(path, "r") as fobj:
+                clknames[cpunum] = fobj.read().strip()
+
+        return clknames[cpunum]
+
+    @staticmethod
+    def check_clockevent(pman, cpunum):
+        """
+        Return 'True' if CPU 'cpunum' on the host defined by 'pman' uses the TSC deadline timer as
+        the clockevent device, and 'False' otherwise.
+        """
+
+        try:
+            return _TSCDeadlineTimer._get_clkname(pman, cpunum) == "lapic-deadline"
+        except Error:
+            return False
+
+    @classmethod
+    def probe_static(cls, pman):
+        """
+        Check if the TSC deadline timer can be used on the host defined by 'pman' without creating
+        the device object. Returns the '(devid, alias, descr)' tuple (see 'scan_devices()') if it
+        can, and 'None' otherwise.
+        """
+
+        if not cls.check_clockevent(pman, 0):
+            return None
+        return "tdt", ", ".join(sorted(cls.aliases)), cls.supported_devices["tdt"]
 
     def __init__(self, devid, cpunum, pman, dmesg=None):
         """The class constructor. The arguments are the same as in '_WultDeviceBase.__init__()'."""
 
         errmsg = f"device '{devid}' is not supported for CPU {cpunum}{pman.hostmsg}."
-        if devid not in self.supported_devices and devid != self.alias:
+        if devid not in self.supported_devices and devid not in self.aliases:
             raise ErrorNotSupported(f"{errmsg}")
 
-        path = Path(f"/sys/devices/system/clockevents/clockevent{cpunum}/current_device")
-        with pman.open(path, "r") as fobj:
-            clkname = fobj.read().strip()
-            if clkname != "lapic-deadline":
-                raise ErrorNotSupported(f"{errmsg}\nCurrent clockevent device is {clkname}, "
-                                        f"should be 'lapic-deadline' (see {path})")
+        clkname = self._get_clkname(pman, cpunum)
+        if clkname != "lapic-deadline":
+            raise ErrorNotSupported(f"{errmsg}\nCurrent clockevent device is {clkname}, should "
+                                    f"be 'lapic-deadline' (see {_CLKEVT_PATH_TMPL.format(cpunum)})")
 
         super().__init__(devid, cpunum, pman, dmesg=dmesg)
 
         self.info["name"] = "tdt"
         self.info["devid"] = devid
-        self.info["alias"] = self.alias
         self.info["descr"] = self.supported_devices["tdt"]
 
 class _LinuxHRTimer(_WultDeviceBase):
@@ -363,14 +599,24 @@ class _LinuxHRTimer(_WultDeviceBase):
     deadline timers.
     """
 
+    __slots__ = ()
+
     drvname = "wult_hrtimer"
     supported_devices = {"hrtimer" : "Linux High Resolution Timer"}
-    alias = "hrt"
+    aliases = frozenset({"hrt"})
+
+    @classmethod
+    def probe_static(cls, pman): # pylint: disable=unused-argument
+        """
+        Same as '_TSCDeadlineTimer.probe_static()'. Linux hrtimers are always available, so this
+        always returns the '(devid, alias, descr)' tuple.
+        """
+        return "hrtimer", ", ".join(sorted(cls.aliases)), cls.supported_devices["hrtimer"]
 
     def __init__(self, devid, cpunum, pman, dmesg=None):
         """The class constructor. The arguments are the same as in '_WultDeviceBase.__init__()'."""
 
-        if devid not in self.supported_devices and devid != self.alias:
+        if devid not in self.supported_devices and devid not in self.aliases:
             raise ErrorNotSupported(f"device '{devid}' is not supported for CPU "
                                     f"{cpunum}{pman.hostmsg}.")
 
@@ -378,20 +624,36 @@ class _LinuxHRTimer(_WultDeviceBase):
 
         self.info["name"] = "hrtimer"
         self.info["devid"] = devid
-        self.info["alias"] = self.alias
         self.info["descr"] = self.supported_devices["hrtimer"]
 
+# All the possible wult device driver names.
+DRVNAMES = frozenset(cls.drvname for cls in (_IntelI210, _TSCDeadlineTimer, _LinuxHRTimer))
+
+# The 'WultDevice()' dispatch table: maps the timer device IDs and aliases to the device classes.
+# Device IDs which are not in the table are handled by the '_IntelI210' class.
+_DEVID_TO_CLASS = {devid : cls for cls in (_TSCDeadlineTimer, _LinuxHRTimer)
+                               for devid in (*cls.supported_devices, *cls.aliases)}
+
 def WultDevice(devid, cpunum, pman, dmesg=None, force=False):
     """
     The wult device object factory - creates and returns the correct type of wult device object
-    depending on 'devid'. The arguments are the same as in '_WultDeviceBase.__init__()'.
+    depending on 'devid'. The arguments are the same as in '_WultDeviceBase.__init__()'. The device
+    class is picked with a single '_DEVID_TO_CLASS' lookup, falling back to the I210 class.
     """
 
-    if devid in _TSCDeadlineTimer.supported_devices or devid in _TSCDeadlineTimer.alias:
-        return _TSCDeadlineTimer(devid, cpunum, pman, dmesg=dmesg)
+    cls = _DEVID_TO_CLASS.get(devid)
+    if cls:
+        return cls(devid, cpunum, pman, dmesg=dmesg)
 
-    if devid in _LinuxHRTimer.supported_devices or devid in _LinuxHRTimer.alias:
-        return _LinuxHRTimer(devid, cpunum, pman, dmesg=dmesg)
+    # The I210 device ID can only be a PCI address or a network interface name. Check for this
+    # upfront, because the '_IntelI210' class goes through all the PCI devices and network
+    # interfaces before figuring out that 'devid' is neither. This is only a syntax check, whether
+    # the device exists is checked later.
+    if not _PCI_ADDR_RE.match(devid) and not _IFID_RE.match(devid):
+        supported = ", ".join(_DEVID_TO_CLASS)
+        raise ErrorNotSupported(f"unsupported device '{devid}'{pman.hostmsg}: it is not a PCI "
+                                f"address or a network interface name, and it is not one of: "
+                                f"{supported}")
 
     try:
         return _IntelI210(devid, cpunum, pman, dmesg=dmesg, force=force)
@@ -414,33 +676,38 @@ def scan_devices(pman, devtypes=None):
     if devtypes is None:
         devtypes = DEVTYPES
 
-    if "tdt" in devtypes:
-        for devid in _TSCDeadlineTimer.supported_devices:
-            with contextlib.suppress(Error):
-                with _TSCDeadlineTimer(devid, 0, pman, dmesg=False) as timerdev:
-                    yield timerdev.info["devid"], timerdev.info["alias"], timerdev.info["descr"]
+    if pman.is_remote:
+        # Every sysfs access is a round-trip to the remote host, so fetch everything at once.
+        with contextlib.suppress(Error):
+            _prefetch_sysfs(pman, devtypes)
 
-    if "hrtimer" in devtypes:
-        for devid in _LinuxHRTimer.supported_devices:
-            with contextlib.suppress(Error):
-                with _LinuxHRTimer(devid, 0, pman, dmesg=False) as timerdev:
-                    yield timerdev.info["devid"], timerdev.info["alias"], timerdev.info["descr"]
+    # The timer devices do not need to be created just to be reported: all the information about
+    # them is static, and the TSC deadline timer only needs a clockevent device check.
+    for devtype, cls in (("tdt", _TSCDeadlineTimer), ("hrtimer", _LinuxHRTimer)):
+        if devtype in devtypes:
+            devinfo = cls.probe_static(pman)
+            if devinfo:
+                yield devinfo
 
     if "i210" in devtypes:
-        for pci_info in LsPCI.LsPCI(pman).get_devices():
+        ifmap = None
+        for pci_info in _get_lspci(pman).get_devices():
             pci_id = pci_info["devid"]
             if not _IntelI210.supported_devices.get(pci_id):
                 continue
 
             devid = pci_info['pciaddr']
 
-            # Find out the Linux network interface name for this NIC, if any.
-            ifname = None
-            with contextlib.suppress(Error):
-                with NetIface.NetIface(devid, pman=pman) as netif:
-                    ifname = netif.ifname
-
-            descr = _IntelI210.supported_devices.get(pci_id)
-            descr += f". PCI address {pci_info['pciaddr']}, Vendor ID {pci_info['vendorid']}, " \
-                     f"Device ID {devid}."
+            # Find out the Linux network interface name for this NIC, if any. Enumerate the network
+            # interfaces only once, and only if there is at least one compatible NIC.
+            if ifmap is None:
+                ifmap = {}
+                with contextlib.suppress(Error):
+                    ifmap = _get_ifmap(pman)
+            ifname = ifmap.get(devid)
+
+            # Note, the scan output has always printed the PCI address as the "Device ID", keep it
+            # this way to keep the output unchanged.
+            base = _IntelI210.supported_devices[pci_id]
+            descr = _PCI_DESCR_TMPL.format_map({**pci_info, "base" : base, "devid" : devid})
             yield devid, ifname, descr
@@ -56,23 +56,16 @@ class LsPCI:
 
         return info
 
-    def get_info(self, devaddr):
+    def _get_devices(self):
         """
-        Return dictionary of PCI device information. Argument 'devaddr' is in format of:
-        [[[[<domain>]:]<bus>]:][<slot>][.[<func>]].
+        Run 'lspci' for all PCI devices, parse the output and return the list of device information
+        dictionaries. The result is cached, so 'lspci' runs only once per class instance.
         """
 
-        cmd = f"{self._lspci_bin} -D -n -vv -s {devaddr}"
-        stdout, _ = self._pman.run_verify(cmd, join=False)
-        if not stdout:
-            raise Error(f"failed to get information for PCI slot: {devaddr}")
-
-        return self._parse_dev_info(stdout)
+        if self._devices is not None:
+            return self._devices
 
-    def get_devices(self):
-        """Generator yields device info as dictionary for each device. """
-
-        cmd = f"{self._lspci_bin} -D -n -v"
+        cmd = f"{self._lspci_bin} -D -n -vv"
         stdout, _ = self._pman.run_verify(cmd, join=False)
 
         # The output structure is as follows:
@@ -86,6 +79,7 @@ class LsPCI:
         #
         # So every line without a space at the beginning is a marker of a new device. Use this
         # property to split the output on per-device chunks.
+        self._devices = []
         lines = []
         for line in stdout:
             if not line.strip():
@@ -95,17 +89,53 @@ class LsPCI:
                 lines.append(line)
             else:
                 if lines:
-                    yield self._parse_dev_info(lines)
+                    self._devices.append(self._parse_dev_info(lines))
                 lines = [line]
 
-    def __init__(self, pman=None):
-        """Class constructor."""
+        if lines:
+            self._devices.append(self._parse_dev_info(lines))
+
+        return self._devices
+
+    def get_info(self, devaddr):
+        """
+        Return dictionary of PCI device information. Argument 'devaddr' is in format of:
+        [[[[<domain>]:]<bus>]:][<slot>][.[<func>]].
+        """
+
+        # Full PCI addresses are looked up in the devices list, but only if it is already available.
+        # Enumerating all the devices just to find one of them is slow.
+        if self._devices is not None:
+            for info in self._devices:
+                if info["pciaddr"] == devaddr:
+                    return info
+
+        cmd = f"{self._lspci_bin} -D -n -vv -s {devaddr}"
+        stdout, _ = self._pman.run_verify(cmd, join=False)
+        if not stdout:
+            raise Error(f"failed to get information for PCI slot: {devaddr}")
+
+        return self._parse_dev_info(stdout)
+
+    def get_devices(self):
+        """Generator yields device info as dictionary for each device. """
+
+        yield from self._get_devices()
+
+    def __init__(self, pman=None, devices=None):
+        """
+        Class constructor. The 'devices' argument can be used to pass the already known list of
+        device information dictionaries (e.g., from an earlier 'get_devices()' call), in which case
+        'lspci' does not run again for all devices.
+        """
 
         if not pman:
             pman = LocalProcessManager.LocalProcessManager()
 
         self._pman = pman
         self._lspci_bin = "lspci"
+        # The cached list of device information dictionaries.
+        self._devices = devices
 
-        if not FSHelpers.which(self._lspci_bin, default=None, pman=pman):
+        if devices is None and not FSHelpers.which(self._lspci_bin, default=None, pman=pman):
             raise ErrorNotSupported(f"the '{self._lspci_bin}' tool is not installed{pman.hostmsg}")
@@ -72,6 +72,19 @@ def _get_ifnames(pman):
     for ifname, _ in _get_ifinfos(pman):
         yield ifname
 
+def get_hwaddr_to_ifname_map(pman=None):
+    """
+    Return a dictionary mapping hardware addresses (e.g., PCI addresses) of the devices backing
+    network interfaces on the system defined by 'pman' to the network interface names. This
+    enumerates the network interfaces only once, so it is cheaper than creating a 'NetIface' object
+    for every hardware address of interest.
+    """
+
+    if not pman:
+        pman = LocalProcessManager.LocalProcessManager()
+
+    return {hwaddr : ifname for ifname, hwaddr in _get_ifinfos(pman)}
+
 def _parse_ip_address_show(raw):
     """
     Parse output of the 'ip address show <IFNAME>' command and return the resulting dictionary.
@@ -14,14 +14,20 @@ this module require the  'args' object which represents the command-line argumen
 
 # pylint: disable=no-member
 
+import re
+import csv
 import sys
 import logging
 from pathlib import Path
-from pepclibs.helperlibs import Trivial, ProcessManager, Logging, YAML
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from pepclibs.helperlibs import ProcessManager, Logging
 from pepclibs.helperlibs.Exceptions import Error
-from wultlibs import DFSummary, Devices
 from wultlibs.helperlibs import ReportID, Human
-from wultlibs.rawresultlibs import RORawResult
+
+# Note, the modules depending on 'pandas' and 'numpy' ('RORawResult', 'DFSummary'), as well as
+# 'Devices' and 'YAML', are imported by the functions using them. Many commands do not need them,
+# and importing them takes a considerable part of the tools start-up time.
 
 HELPERS_LOCAL_DIR = Path(".local")
 _DRV_SRC_SUBPATH = Path("drivers/idle")
@@ -29,6 +35,23 @@ _HELPERS_SRC_SUBPATH = Path("helpers")
 
 _LOG = logging.getLogger()
 
+# The filter and selector options that operate on rows and columns.
+_ROW_FILTER_OPS = frozenset(("rfilt", "rsel"))
+_COLUMN_FILTER_OPS = frozenset(("cfilt", "csel"))
+# The raw test result methods for setting the filters and selectors.
+_FILTER_SETTERS = {name : f"set_{name}" for name in _ROW_FILTER_OPS | _COLUMN_FILTER_OPS}
+# How many datapoints the 'filter' command loads at a time when it does not need all of them.
+_FILTER_CHUNKSIZE = 65536
+# Maximum count of threads for processing multiple test results.
+_MAX_WORKERS = 8
+# Column and summary function names that can be written to YAML as is, without quoting. Names that
+# YAML loaders resolve to booleans or null (e.g., 'on' or 'null') must be quoted, so they are
+# excluded.
+_YAML_PLAIN_KEY_RE = re.compile(r"(?!(?i:null|true|false|yes|no|on|off)$)[A-Za-z_][\w.%]*|"
+                                r"\d[\d.]*%")
+# The separator of comma-separated lists in command-line arguments.
+_CSV_SEP_RE = re.compile(r"\s*,\s*")
+
 # Description for the '--datapoints' option of the 'start' command.
 DATAPOINTS_DESCR = """How many datapoints should the test result include, default is 1000000. Note,
                       unless the '--start-over' option is used, the pre-existing datapoints are
@@ -58,6 +81,7 @@ START_OVER_DESCR = """If the output directory already contains the datapoints CS
 START_OUTDIR_DESCR = """Path to the directory to store the results at."""
 
 # Description for the '--reportid' option of the 'start' command.
+@lru_cache(maxsize=None)
 def get_start_reportid_descr(allowed_chars):
     """
     Returns description for the '--reportid' option of the 'start' command. The 'allowed_chars'
@@ -75,6 +99,7 @@ START_REPORT_DESCR = """Generate an HTML report for collected results (same as c
                         command with default arguments)."""
 
 # Description for the '--outdir' option of the 'report' command.
+@lru_cache(maxsize=None)
 def get_report_outdir_descr(toolname):
     """
     Returns description for the '--outdir' option of the 'report' command for the 'toolname' tool.
@@ -228,6 +253,16 @@ def get_pman(args):
     return ProcessManager.get_pman(args.hostname, username=username, privkeypath=privkeypath,
                                    timeout=timeout)
 
+def _split_csv_line(line):
+    """
+    Split a comma-separated list in 'line' and return the list of items. Same as
+    'Trivial.split_csv_line()', but uses a pre-compiled regular expression.
+    """
+
+    if not line:
+        return []
+    return [item for item in _CSV_SEP_RE.split(line.strip()) if item]
+
 def _validate_range(rng, what, single_ok):
     """Implements 'parse_ldist()'."""
 
@@ -236,25 +271,24 @@ def _validate_range(rng, what, single_ok):
     else:
         min_len = 2
 
-    split_rng = Trivial.split_csv_line(rng)
+    split_rng = _split_csv_line(rng)
 
     if len(split_rng) < min_len:
         raise Error(f"bad {what} range '{rng}', it should include {min_len} numbers")
     if len(split_rng) > 2:
         raise Error(f"bad {what} range '{rng}', it should not include more than 2 numbers")
 
-    vals = [None] * len(split_rng)
+    vals = [Human.parse_duration_ns(val, default_unit="us", name=what) for val in split_rng]
 
-    for idx, val in enumerate(split_rng):
-        vals[idx] = Human.parse_duration_ns(val, default_unit="us", name=what)
-        if vals[idx] < 0:
-            raise Error(f"bad {what} value '{split_rng[idx]}', should be greater than zero")
+    for val, strval in zip(vals, split_rng):
+        if val < 0:
+            raise Error(f"bad {what} value '{strval}', should be greater than zero")
 
-    if len(vals) == 2 and vals[1] - vals[0] < 0:
+    if len(vals) == 1:
+        vals *= 2
+    elif vals[1] < vals[0]:
         raise Error(f"bad {what} range '{rng}', first number cannot be greater than the second "
                     f"number")
-    if len(vals) == 1:
-        vals.append(vals[0])
 
     return vals
 
@@ -292,6 +326,54 @@ def parse_ldist(ldist, single_ok=True):
 
     return _validate_range(ldist, "launch distance", single_ok)
 
+def parse_dpcnt(dpcnt):
+    """
+    Parse and validate the datapoints count ('--datapoints' option). Returns the datapoints count
+    as an integer.
+    """
+
+    try:
+        result = int(dpcnt)
+    except (TypeError, ValueError):
+        result = 0
+
+    if result <= 0:
+        raise Error(f"bad datapoints count '{dpcnt}', should be a positive integer")
+
+    return result
+
+def _parallel_map(func, items):
+    """
+    Call 'func' for every item in 'items' using a pool of threads and return the list of results.
+    This is used for overlapping I/O when processing multiple test results.
+    """
+
+    items = list(items)
+    if len(items) < 2:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
+
+def _count_csv_rows(path):
+    """Returns the count of data rows (excluding the header) in the CSV file at 'path'."""
+
+    cnt = 0
+    last = b"\n"
+    try:
+        with open(path, "rb") as fobj:
+            for chunk in iter(lambda: fobj.read(1024 * 1024), b""):
+                cnt += chunk.count(b"\n")
+                last = chunk[-1:]
+    except OSError as err:
+        raise Error(f"failed to read '{path}': {err}") from None
+
+    # The last line may have no trailing newline.
+    if last != b"\n":
+        cnt += 1
+
+    return max(cnt - 1, 0)
+
 def even_up_dpcnt(rsts):
     """
     This is a helper function for the '--even-up-datapoints' option. It takes a list of
@@ -299,32 +381,18 @@ def even_up_dpcnt(rsts):
     "size" is defined as the count of rows in the CSV file.
     """
 
-    # Find test with the smallest CSV file. It should be a good approximation for the smallest test
-    # result, ant it will be corrected as we go.
-    min_size = min_res = None
-    for res in rsts:
-        try:
-            size = res.dp_path.stat().st_size
-        except OSError as err:
-            raise Error(f"'stat()' failed for '{res.dp_path}': {err}") from None
-        if min_size is None or size < min_size:
-            min_size = size
-            min_res = res
-
-    min_res.load_df()
-    min_dpcnt = len(min_res.df.index)
-
-    # Load only 'min_dpcnt' datapoints for every test result, correcting 'min_dpcnt' as we go.
-    for res in rsts:
-        res.load_df(nrows=min_dpcnt)
-        min_dpcnt = min(min_dpcnt, len(res.df.index))
+    # Count the datapoints in every test result without parsing the CSV files.
+    min_dpcnt = min(_parallel_map(lambda res: _count_csv_rows(res.dp_path), rsts))
+
+    # Load only 'min_dpcnt' datapoints for every test result. Row filters may drop some of the
+    # loaded datapoints, so correct 'min_dpcnt' afterwards.
+    _parallel_map(lambda res: res.load_df(nrows=min_dpcnt), rsts)
+    min_dpcnt = min(res.df.shape[0] for res in rsts)
 
-    # And in case our initial 'min_dpcnt' estimation was incorrect, truncate all the results to the
-    # final 'min_dpcnt'.
+    # If some datapoints were filtered out, truncate all the results to the final 'min_dpcnt'.
     for res in rsts:
-        dpcnt = len(res.df.index)
-        if dpcnt > min_dpcnt:
-            res.df = res.df.truncate(after=min_dpcnt-1)
+        if res.df.shape[0] > min_dpcnt:
+            res.df = res.df.iloc[:min_dpcnt]
 
 def set_filters(args, res):
     """
@@ -340,9 +408,9 @@ def set_filters(args, res):
         res.clear_filts()
         for name, expr in ops.items():
             # The '--csel' and '--cfilt' options may have comma-separated list of column names.
-            if name.startswith("c"):
-                expr = Trivial.split_csv_line(expr)
-            getattr(res, f"set_{name}")(expr)
+            if name in _COLUMN_FILTER_OPS:
+                expr = _split_csv_line(expr)
+            getattr(res, _FILTER_SETTERS[name])(expr)
 
     if not getattr(args, "oargs", None):
         return
@@ -363,29 +431,54 @@ def apply_filters(args, res):
 def scan_command(args):
     """Implements the 'scan' command for the 'wult' and 'ndl' tools."""
 
+    from wultlibs import Devices # pylint: disable=import-outside-toplevel
+
     pman = get_pman(args)
 
-    msg = ""
+    lines = []
     for devid, alias, descr in Devices.scan_devices(pman, args.devtypes):
-        msg += f" * Device ID: {devid}\n"
+        lines.append(f" * Device ID: {devid}")
         if alias:
-            msg += f"   - Alias: {alias}\n"
-        msg += f"   - Description: {descr}\n"
+            lines.append(f"   - Alias: {alias}")
+        lines.append(f"   - Description: {descr}")
 
-    if not msg:
+    if not lines:
         _LOG.info("No %s compatible devices found", args.toolname)
         return
 
-    _LOG.info("Compatible device(s)%s:\n%s", pman.hostmsg, msg.rstrip())
+    _LOG.info("Compatible device(s)%s:\n%s", pman.hostmsg, "\n".join(lines))
+
+def _write_csv(df, fobj, header=True):
+    """
+    Write 'pandas.DataFrame' 'df' to file object 'fobj' in CSV format, same as
+    'df.to_csv(fobj, index=False, header=header)' does, but with less per-row overhead.
+    """
+
+    columns = []
+    for colname in df.columns:
+        column = df[colname]
+        if column.hasnans:
+            # 'df.to_csv()' writes missing values as empty fields, but 'csv.writer' would write
+            # 'nan'.
+            column = column.astype(object).where(column.notna(), "")
+        columns.append(column.tolist())
+
+    writer = csv.writer(fobj, lineterminator="\n")
+    if header:
+        writer.writerow(df.columns)
+    writer.writerows(zip(*columns))
 
 def filter_command(args):
     """Implements the 'filter' command for the 'wult' and 'ndl' tools."""
 
+    from wultlibs.rawresultlibs import RORawResult # pylint: disable=import-outside-toplevel
+
     res = RORawResult.RORawResult(args.respath)
 
     if args.list_columns:
+        info = res.defs.info
         for colname in res.colnames:
-            _LOG.info("%s: %s", colname, res.defs.info[colname]["title"])
+            _LOG.info("%s: %s", colname, info[colname]["title"])
         return
 
     if not getattr(args, "oargs", None):
@@ -396,28 +489,70 @@ def filter_command(args):
     if args.human_readable and args.outdir:
         raise Error("'--human-readable' and '--outdir' are mutually exclusive")
 
+    if not args.outdir and not args.human_readable and \
+       not any(name in _ROW_FILTER_OPS for name in args.oargs):
+        # Only columns are filtered, so there is no need to load all the datapoints at once.
+        set_filters(args, res)
+        header = True
+        for chunk in res.iter_df_chunks(_FILTER_CHUNKSIZE):
+            _write_csv(chunk, sys.stdout, header=header)
+            header = False
+        return
+
     apply_filters(args, res)
 
     if args.outdir:
         res.save(args.outdir, reportid=args.reportid)
     elif not args.human_readable:
-        res.df.to_csv(sys.stdout, index=False, header=True)
+        _write_csv(res.df, sys.stdout)
     else:
         for idx, (_, dp) in enumerate(res.df.iterrows()):
             if idx > 0:
                 _LOG.info("")
             _LOG.info(Human.dict2str(dict(dp)))
 
+def _dump_smrys(smrys, fobj):
+    """
+    Write the summaries dictionary 'smrys' (see 'RORawResult.calc_smrys()') to file object 'fobj'
+    in YAML format, formatting floating point values with 2 digits after the point. This is a lot
+    faster than the generic YAML dumper, but it supports only plain column and function names and
+    numeric values. Returns 'False' without writing anything if 'smrys' contains anything else.
+    """
+
+    lines = []
+    for colname, subdict in smrys.items():
+        if not subdict or not _YAML_PLAIN_KEY_RE.fullmatch(colname):
+            return False
+        lines.append(f"{colname}:")
+        for funcname, datum in subdict.items():
+            if not _YAML_PLAIN_KEY_RE.fullmatch(funcname):
+                return False
+            if isinstance(datum, float):
+                lines.append(f"  {funcname}: {datum:.2f}")
+            elif isinstance(datum, int) and not isinstance(datum, bool):
+                lines.append(f"  {funcname}: {datum}")
+            else:
+                return False
+
+    lines.append("")
+    fobj.write("\n".join(lines))
+    return True
+
 def calc_command(args):
     """Implements the 'calc' command  for the 'wult' and 'ndl' tools."""
 
+    # pylint: disable=import-outside-toplevel
+    from pepclibs.helperlibs import YAML
+    from wultlibs import DFSummary
+    from wultlibs.rawresultlibs import RORawResult
+
     if args.list_funcs:
         for name, descr in DFSummary.get_smry_funcs():
             _LOG.info("%s: %s", name, descr)
         return
 
     if args.funcs:
-        funcnames = Trivial.split_csv_line(args.funcs)
+        funcnames = _split_csv_line(args.funcs)
         all_funcs = True
     else:
         funcnames = None
@@ -434,7 +569,8 @@ def calc_command(args):
     res.calc_smrys(funcnames=funcnames, all_funcs=all_funcs)
 
     _LOG.info("Datapoints count: %d", len(res.df))
-    YAML.dump(res.smrys, sys.stdout, float_format="%.2f")
+    if not _dump_smrys(res.smrys, sys.stdout):
+        YAML.dump(res.smrys, sys.stdout, float_format="%.2f")
 
 def open_raw_results(respaths, toolname, reportids=None, reportid_additional_chars=None):
     """
@@ -446,8 +582,10 @@ def open_raw_results(respaths, toolname, reportids=None, reportid_additional_cha
                                     characters.
     """
 
+    from wultlibs.rawresultlibs import RORawResult # pylint: disable=import-outside-toplevel
+
     if reportids:
-        reportids = Trivial.split_csv_line(reportids)
+        reportids = _split_csv_line(reportids)
     else:
         reportids = []
 
@@ -459,16 +597,17 @@ def open_raw_results(respaths, toolname, reportids=None, reportid_additional_cha
     # the 'respaths' list.
     reportids += [None] * (len(respaths) - len(reportids))
 
-    rsts = []
-    for respath, reportid in zip(respaths, reportids):
+    for reportid in reportids:
         if reportid:
             ReportID.validate_reportid(reportid, additional_chars=reportid_additional_chars)
 
-        res = RORawResult.RORawResult(respath, reportid=reportid)
+    rsts = _parallel_map(lambda args: RORawResult.RORawResult(args[0], reportid=args[1]),
+                         zip(respaths, reportids))
+
+    for respath, res in zip(respaths, rsts):
         if toolname != res.info["toolname"]:
             raise Error(f"cannot generate '{toolname}' report, results are collected with the"
                         f"'{res.info['toolname']}':\n{respath}")
-        rsts.append(res)
 
     return rsts
 
@@ -477,8 +616,10 @@ def list_result_columns(rsts):
     Implements the '--list-columns' option by printing the column names for each raw result 'rsts'.
     """
 
+    log = _LOG.info
     for rst in rsts:
-        _LOG.info("Column names in '%s':", rst.dirpath)
+        log("Column names in '%s':", rst.dirpath)
+        info = rst.defs.info
         for colname in rst.colnames:
-            if colname in rst.defs.info:
-                _LOG.info("  * %s: %s", colname, rst.defs.info[colname]["title"])
+            if colname in info:
+                log("  * %s: %s", colname, info[colname]["title"])
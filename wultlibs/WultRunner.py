@@ -28,10 +28,11 @@ _MAX_FTRACE_BAD_LINES = 10
 class WultRunner:
     """Run wake latency measurement experiments."""
 
-    def _validate_datapoint(self, fields, vals):
+    def _validate_datapoint(self, fields, vals, ftline):
         """
         This is a helper function for '_get_datapoints()' which checks that every raw datapoint
-        from the trace buffer has the same fields in the same order.
+        from the trace buffer has the same fields in the same order. The 'ftline' argument is the
+        trace buffer line the datapoint comes from.
         """
 
         if len(fields) != len(self._fields) or len(vals) != len(self._fields) or \
@@ -44,7 +45,7 @@ class WultRunner:
                         f"New datapoint fields count: {len(self._fields)}\n"
                         f"Fist datapoint fields:\n{old_fields}\n"
                         f"New datapoint fields:\n{new_fields}\n\n"
-                        f"New datapoint full ftrace line:\n{self._ftrace.raw_line}")
+                        f"New datapoint full ftrace line:\n{ftline.line}")
 
     def _get_datapoints(self):
         """
@@ -75,7 +76,7 @@ class WultRunner:
                 last_line = line.msg
 
                 if self._fields:
-                    self._validate_datapoint(fields, vals)
+                    self._validate_datapoint(fields, vals, line)
                 else:
                     self._fields = fields
 
@@ -10,6 +10,7 @@
 This module provides API for dealing with Linux function trace buffer.
 """
 
+import re
 import logging
 from pepclibs.helperlibs import FSHelpers
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported, ErrorTimeOut
@@ -17,10 +18,17 @@ from wultlibs.helperlibs import ProcHelpers
 
 _LOG = logging.getLogger()
 
+# The trace buffer line regular expression. Note, the process name may include dashes and spaces.
+_FTLINE_RE = re.compile(r"(?P<procname>.+?)-(?P<pid>\d+)\s+(?P<cpunum>\S+)\s+(?P<flags>\S+)\s+"
+                        r"(?P<timestamp>\S+)\s+(?P<func>\S+)\s+(?P<msg>.+)")
+_FTLINE_FIELDS = tuple(_FTLINE_RE.groupindex)
+
+# Maximum count of trace buffer lines to read from the trace reader process at a time.
+_READ_LINES = 256
+
 class FTraceLine():
     """
-    This class represents an ftrace buffer line. When an instance is created, the trace buffer line
-    is split and the following attributes become available.
+    This class represents an ftrace buffer line. The following attributes are available.
       * procname - process name.
       * pid - process PID.
       * cpunum - logical CPU number.
@@ -30,24 +38,34 @@ class FTraceLine():
       * msg - the trace buffer message (comes after all the standard prefixes inlcuding process
       *       name, PID, etc)
       * line - full trace buffer line (includs all the standard prefixes)
+
+    The trace buffer may contain a huge amount of lines, so the line is split only when one of the
+    attributes is accessed for the first time.
     """
 
+    __slots__ = ("line",) + _FTLINE_FIELDS
+
+    def __getattr__(self, name):
+        """Split the trace buffer line on the first access to one of the line fields."""
+
+        if name not in _FTLINE_FIELDS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        match = _FTLINE_RE.match(self.line)
+        if match:
+            values = match.groups()
+        else:
+            values = (None,) * len(_FTLINE_FIELDS)
+
+        for field, value in zip(_FTLINE_FIELDS, values):
+            setattr(self, field, value)
+
+        return getattr(self, name)
+
     def __init__(self, line):
         """Create a class instance for trace buffer line 'line'."""
 
         self.line = line.strip()
-        self.procname = None
-        self.pid = None
-        self.cpunum = None
-        self.flags = None
-        self.timestamp = None
-        self.func = None
-        self.msg = None
-
-        split = self.line.split(maxsplit=5)
-        if len(split) == 6:
-            procinfo, self.cpunum, self.flags, self.timestamp, self.func, self.msg = split
-            self.procname, self.pid = procinfo.split("-")
 
 class FTrace:
     """This class represents the Linux function trace buffer."""
@@ -65,8 +83,8 @@ class FTrace:
         """
 
         while True:
-            stdout, stderr, exitcode = self._reader.wait(timeout=self.timeout, lines=[32, None],
-                                                         join=False)
+            stdout, stderr, exitcode = self._reader.wait(timeout=self.timeout,
+                                                         lines=[_READ_LINES, None], join=False)
 
             if not stdout and not stderr and exitcode is None:
                 raise ErrorTimeOut(f"no data in trace buffer for {self._reader.timeout} seconds"
@@ -79,9 +97,11 @@ class FTrace:
                 raise Error(f"the function trace reader process has exited unexpectedly:\n{msg}")
 
             for line in stdout:
-                if line.startswith("#"):
+                # Note, 'FTraceLine()' strips the line again, but this is cheap, because stripping
+                # an already stripped string returns the same string object.
+                line = line.strip()
+                if not line or line.startswith("#"):
                     continue
-                self.raw_line = line.strip()
                 yield FTraceLine(line)
 
     def __init__(self, pman, timeout=30):
@@ -94,7 +114,6 @@ class FTrace:
         self._reader = None
         self._pman = pman
         self.timeout = timeout
-        self.raw_line = None
 
         mntpoint = FSHelpers.mount_debugfs(pman=pman)
         self.ftpath = mntpoint.joinpath("tracing/trace")
@@ -10,22 +10,27 @@
 
 """ndl - a tool for measuring memory access latency observed by a network card."""
 
+import os
 import sys
 import logging
 from pathlib import Path
+from functools import lru_cache
 
-try:
-    import argcomplete
-except ImportError:
-    # We can live without argcomplete, we only lose tab completions.
+# The 'argcomplete' module is needed only when it completes the command line, which it signals
+# with the '_ARGCOMPLETE' environment variable.
+if "_ARGCOMPLETE" in os.environ:
+    try:
+        import argcomplete
+    except ImportError:
+        # We can live without argcomplete, we only lose tab completions.
+        argcomplete = None
+else:
     argcomplete = None
 
 from pepclibs.helperlibs import Logging, ArgParse, Trivial
 from pepclibs.helperlibs.Exceptions import Error
-from wultlibs import Deploy, ToolsCommon, NdlRunner, NetIface
+from wultlibs import ToolsCommon
 from wultlibs.helperlibs import ReportID, Human
-from wultlibs.rawresultlibs import WORawResult
-from wultlibs.htmlreport import NdlReport
 
 VERSION = "1.3.13"
 OWN_NAME = "ndl"
@@ -33,33 +38,55 @@ OWN_NAME = "ndl"
 LOG = logging.getLogger()
 Logging.setup_logger(prefix=OWN_NAME)
 
+@lru_cache(maxsize=None)
 def get_axes_default(name):
     """Returns the default CSV column names for X- or Y-axes, as well as histograms."""
 
+    from wultlibs.htmlreport import NdlReport # pylint: disable=import-outside-toplevel
+
     names = getattr(NdlReport, f"DEFAULT_{name.upper()}")
     # The result is used for argparse, which does not accept '%' symbols.
     return names.replace("%", "%%")
 
-def build_arguments_parser():
-    """Build and return the arguments parser object."""
+@lru_cache(maxsize=None)
+def _get_ldist_descr():
+    """Returns description for the '--ldist' option of the 'start' command."""
 
-    text = "ndl - a tool for measuring memory access latency observed by a network card."
-    parser = ArgParse.SSHOptsAwareArgsParser(description=text, prog=OWN_NAME, ver=VERSION)
+    return f"""The launch distance in microseconds. This tool works by scheduling a delayed network
+               packet, then sleeping and waiting for the packet to be sent. This step is referred to
+               as a "measurement cycle" and it is usually repeated many times. The launch distance
+               defines how far in the future the delayed network packets are scheduled. By
+               default this tool randomly selects launch distance in range of [5000, 50000]
+               microseconds (same as '--ldist 5000,50000'). Specify a comma-separated range or a
+               single value if you want launch distance to be precisely that value all the time. The
+               default unit is microseconds, but you can use the following specifiers as well:
+               {Human.DURATION_NS_SPECS_DESCR}. For example, '--ldist 500us,100ms' would be a
+               [500,100000] microseconds range.  Note, too low values may cause failures or prevent
+               the SUT from reaching deep C-states. The optimal value is system-specific."""
 
-    text = "Force coloring of the text output."
-    parser.add_argument("--force-color", action="store_true", help=text)
-    subparsers = parser.add_subparsers(title="commands", metavar="")
-    subparsers.required = True
+@lru_cache(maxsize=None)
+def _get_keep_filtered_descr():
+    """Returns description for the '--keep-filtered' option of the 'start' command."""
+
+    return f"""{ToolsCommon.KEEP_FILTERED_DESCR} Here is an example. Suppose you want to collect
+               100000 datapoints where RTD is greater than 50 microseconds. In this case, you can
+               use these options: -c 100000 --rfilt="RTD > 50". The result will contain 100000
+               datapoints, all of them will have RTD bigger than 50 microseconds. But what if you do
+               not want to simply discard the other datapoints, because they are also interesting?
+               Well, add the '--keep-filtered' option. The result will contain, say, 150000
+               datapoints, 100000 of which will have RTD value greater than 50."""
+
+def _add_deploy_parser(subparsers):
+    """Add the 'deploy' command parser to 'subparsers'."""
+
+    from wultlibs import Deploy # pylint: disable=import-outside-toplevel
 
-    #
-    # Create parsers for the "deploy" command.
-    #
     Deploy.add_deploy_cmdline_args(subparsers, OWN_NAME, Deploy.deploy_command, drivers=True,
                                    helpers=["ndlrunner"], argcomplete=argcomplete)
 
-    #
-    # Create parsers for the "scan" command.
-    #
+def _add_scan_parser(subparsers):
+    """Add the 'scan' command parser to 'subparsers'."""
+
     text = "Scan for device id."
     descr = """Scan for compatible device."""
     subpars = subparsers.add_parser("scan", help=text, description=descr)
@@ -67,9 +94,9 @@ def build_arguments_parser():
 
     ArgParse.add_ssh_options(subpars)
 
-    #
-    # Create parsers for the "start" command.
-    #
+def _add_start_parser(subparsers):
+    """Add the 'start' command parser to 'subparsers'."""
+
     text = "Start the measurements."
     descr = """Start measuring and recording the latency data."""
     subpars = subparsers.add_parser("start", help=text, description=descr)
@@ -89,29 +116,12 @@ def build_arguments_parser():
     text = ToolsCommon.get_start_reportid_descr(ReportID.get_charset_descr())
     subpars.add_argument("--reportid", help=text)
 
-    text = f"""The launch distance in microseconds. This tool works by scheduling a delayed network
-               packet, then sleeping and waiting for the packet to be sent. This step is referred to
-               as a "measurement cycle" and it is usually repeated many times. The launch distance
-               defines how far in the future the delayed network packets are scheduled. By
-               default this tool randomly selects launch distance in range of [5000, 50000]
-               microseconds (same as '--ldist 5000,50000'). Specify a comma-separated range or a
-               single value if you want launch distance to be precisely that value all the time. The
-               default unit is microseconds, but you can use the following specifiers as well:
-               {Human.DURATION_NS_SPECS_DESCR}. For example, '--ldist 500us,100ms' would be a
-               [500,100000] microseconds range.  Note, too low values may cause failures or prevent
-               the SUT from reaching deep C-states. The optimal value is system-specific."""
-    subpars.add_argument("-l", "--ldist", default="5000,50000", help=text)
+    subpars.add_argument("-l", "--ldist", default="5000,50000", help=_get_ldist_descr())
 
     subpars.add_argument("--rfilt", action=ArgParse.OrderedArg, help=ToolsCommon.RFILT_START_DESCR)
     subpars.add_argument("--rsel", action=ArgParse.OrderedArg, help=ToolsCommon.RSEL_DESCR)
-    text = f"""{ToolsCommon.KEEP_FILTERED_DESCR} Here is an example. Suppose you want to collect
-               100000 datapoints where RTD is greater than 50 microseconds. In this case, you can
-               use these options: -c 100000 --rfilt="RTD > 50". The result will contain 100000
-               datapoints, all of them will have RTD bigger than 50 microseconds. But what if you do
-               not want to simply discard the other datapoints, because they are also interesting?
-               Well, add the '--keep-filtered' option. The result will contain, say, 150000
-               datapoints, 100000 of which will have RTD value greater than 50."""
-    subpars.add_argument("--keep-filtered", action="store_true", help=text)
+    subpars.add_argument("--keep-filtered", action="store_true",
+                         help=_get_keep_filtered_descr())
 
     text = """Generate an HTML report for collected results (same as calling 'report' command with
               default arguments)."""
@@ -122,9 +132,9 @@ def build_arguments_parser():
               (e.g., eth0)."""
     subpars.add_argument("ifname", help=text)
 
-    #
-    # Create parsers for the "report" command.
-    #
+def _add_report_parser(subparsers):
+    """Add the 'report' command parser to 'subparsers'."""
+
     text = "Create an HTML report."
     descr = """Create an HTML report for one or multiple test results."""
     subpars = subparsers.add_parser("report", help=text, description=descr)
@@ -148,9 +158,9 @@ def build_arguments_parser():
     text = f"""One or multiple {OWN_NAME} test result paths."""
     subpars.add_argument("respaths", nargs="+", type=Path, help=text)
 
-    #
-    # Create parsers for the "filter" command.
-    #
+def _add_filter_parser(subparsers):
+    """Add the 'filter' command parser to 'subparsers'."""
+
     text = "Filter datapoints out of a test result."
     subpars = subparsers.add_parser("filter", help=text, description=ToolsCommon.FILT_DESCR)
     subpars.set_defaults(func=ToolsCommon.filter_command)
@@ -168,9 +178,9 @@ def build_arguments_parser():
     text = f"The {OWN_NAME} test result path to filter."
     subpars.add_argument("respath", type=Path, help=text)
 
-    #
-    # Create parsers for the "calc" command.
-    #
+def _add_calc_parser(subparsers):
+    """Add the 'calc' command parser to 'subparsers'."""
+
     text = f"Calculate summary functions for a {OWN_NAME} test result."
     descr = f"""Calculates various summary functions for a {OWN_NAME} test result (e.g., the median
                 value for one of the CSV columns)."""
@@ -187,6 +197,47 @@ def build_arguments_parser():
     text = f"""The {OWN_NAME} test result path to calculate summary functions for."""
     subpars.add_argument("respath", type=Path, help=text)
 
+# The command name -> command parser builder function map.
+_SUBPARSER_BUILDERS = {"deploy" : _add_deploy_parser,
+                       "scan" : _add_scan_parser,
+                       "start" : _add_start_parser,
+                       "report" : _add_report_parser,
+                       "filter" : _add_filter_parser,
+                       "calc" : _add_calc_parser}
+
+def _is_completing():
+    """Returns 'True' if the command line is being completed by 'argcomplete'."""
+    return argcomplete is not None
+
+def build_arguments_parser(argv=None):
+    """
+    Build and return the arguments parser object. If the command line arguments list 'argv' is
+    provided, build only the parser of the command found in 'argv'. Parsers of all commands are
+    built if 'argv' is not provided or there is no command in 'argv' (e.g., 'ndl -h'), as well as
+    when 'argcomplete' completes the command line.
+    """
+
+    text = "ndl - a tool for measuring memory access latency observed by a network card."
+    parser = ArgParse.SSHOptsAwareArgsParser(description=text, prog=OWN_NAME, ver=VERSION)
+
+    text = "Force coloring of the text output."
+    parser.add_argument("--force-color", action="store_true", help=text)
+    subparsers = parser.add_subparsers(title="commands", metavar="")
+    subparsers.required = True
+
+    names = None
+    if argv and not _is_completing():
+        for arg in argv:
+            if arg in _SUBPARSER_BUILDERS:
+                names = (arg,)
+                break
+
+    if not names:
+        names = _SUBPARSER_BUILDERS
+
+    for name in names:
+        _SUBPARSER_BUILDERS[name](subparsers)
+
     if argcomplete:
         argcomplete.autocomplete(parser)
 
@@ -195,7 +246,7 @@ def build_arguments_parser():
 def parse_arguments():
     """Parse input arguments."""
 
-    parser = build_arguments_parser()
+    parser = build_arguments_parser(argv=sys.argv[1:])
 
     args = parser.parse_args()
     args.toolname = OWN_NAME
@@ -207,6 +258,10 @@ def parse_arguments():
 def start_command(args):
     """Implements the 'start' command."""
 
+    # pylint: disable=import-outside-toplevel
+    from wultlibs import Deploy, NdlRunner, NetIface
+    from wultlibs.rawresultlibs import WORawResult
+
     pman = ToolsCommon.get_pman(args)
 
     if not args.reportid and pman.is_remote:
@@ -234,9 +289,7 @@ def start_command(args):
             msg += f" -H {pman.hostname}"
         LOG.warning(msg)
 
-    if not Trivial.is_int(args.dpcnt) or int(args.dpcnt) <= 0:
-        raise Error(f"bad datapoints count '{args.dpcnt}', should be a positive integer")
-    args.dpcnt = int(args.dpcnt)
+    args.dpcnt = ToolsCommon.parse_dpcnt(args.dpcnt)
 
     with WORawResult.NdlWORawResult(args.reportid, args.outdir, VERSION) as res:
         ToolsCommon.setup_stdout_logging(OWN_NAME, res.logs_path)
@@ -249,12 +302,21 @@ def start_command(args):
                            "the measured latency.", args.ifname)
 
             with NdlRunner.NdlRunner(pman, netif, res, ndlrunner_bin, ldist=args.ldist) as runner:
-                runner.prepare()
-                runner.run(dpcnt=args.dpcnt, tlimit=args.tlimit)
+                try:
+                    runner.prepare()
+                    runner.run(dpcnt=args.dpcnt, tlimit=args.tlimit)
+                except Error:
+                    # The driver or the 'ndlrunner' helper may be missing or broken on the SUT, make
+                    # sure the next run checks the SUT instead of trusting the cached deployment
+                    # state.
+                    Deploy.clear_deploy_state(pman, OWN_NAME)
+                    raise
 
     if not args.report:
         return
 
+    from wultlibs.htmlreport import NdlReport # pylint: disable=import-outside-toplevel
+
     rsts = ToolsCommon.open_raw_results([args.outdir], args.toolname)
     rep = NdlReport.NdlReport(rsts, args.outdir, title_descr=args.reportid)
     rep.relocatable = False
@@ -263,6 +325,8 @@ def start_command(args):
 def report_command(args):
     """Implements the 'report' command."""
 
+    from wultlibs.htmlreport import NdlReport # pylint: disable=import-outside-toplevel
+
     # Split the comma-separated lists.
     for name in ("xaxes", "yaxes", "hist", "chist"):
         val = getattr(args, name)
@@ -12,15 +12,21 @@
 wult - a tool for measuring C-state latency.
 """
 
+import os
 import sys
 import logging
 import contextlib
 from pathlib import Path
 
-try:
-    import argcomplete
-except ImportError:
-    # We can live without argcomplete, we only lose tab completions.
+# The 'argcomplete' module is needed only when it completes the command line, which it signals
+# with the '_ARGCOMPLETE' environment variable.
+if "_ARGCOMPLETE" in os.environ:
+    try:
+        import argcomplete
+    except ImportError:
+        # We can live without argcomplete, we only lose tab completions.
+        argcomplete = None
+else:
     argcomplete = None
 
 from pepclibs.helperlibs import Logging, ArgParse, Trivial
@@ -367,7 +373,7 @@ def parse_arguments():
 
     return args
 
-def check_settings(pman, dev, csinfo, cpunum, devid):
+def check_settings(pman, dev, csinfo, cpunum, devid, cpuinfo=None):
     """
     Some settings of the SUT may lead to results that are potentially confusing for the user. This
     function looks for such settings and if found, prints a notice message.
@@ -376,6 +382,7 @@ def check_settings(pman, dev, csinfo, cpunum, devid):
       * devid - the ID of the device used for measuring the latency.
       * csinfo - cstate info from 'CStates.get_cstates_info()'.
       * cpunum - the logical CPU number to measure.
+      * cpuinfo - an optional 'CPUInfo.CPUInfo()' object for the host defined by 'pman'.
     """
 
     if dev.info.get("aspm_enabled"):
@@ -387,7 +394,8 @@ def check_settings(pman, dev, csinfo, cpunum, devid):
         if info["disable"] == 0 and info["name"] != "POLL":
             enabled_cstates.append(info["name"])
 
-    with contextlib.suppress(ErrorNotSupported), PowerCtl.PowerCtl(pman=pman) as powerctl:
+    with contextlib.suppress(ErrorNotSupported), \
+         PowerCtl.PowerCtl(pman=pman, cpuinfo=cpuinfo) as powerctl:
         # Check for the following 3 conditions to be true at the same time.
         # * C6 is enabled.
         # * C6 pre-wake is enabled.
@@ -458,9 +466,7 @@ def start_command(args):
     if args.ldist:
         args.ldist = ToolsCommon.parse_ldist(args.ldist)
 
-    if not Trivial.is_int(args.dpcnt) or int(args.dpcnt) <= 0:
-        raise Error(f"bad datapoints count '{args.dpcnt}', should be a positive integer")
-    args.dpcnt = int(args.dpcnt)
+    args.dpcnt = ToolsCommon.parse_dpcnt(args.dpcnt)
 
     args.tsc_cal_time = Human.parse_duration(args.tsc_cal_time, default_unit="s",
                                             name="TSC calculation time")
@@ -489,18 +495,28 @@ def start_command(args):
         dev = Devices.WultDevice(args.devid, args.cpunum, pman, dmesg=True, force=args.force)
         stack.enter_context(dev)
 
-        rcsobj = CStates.ReqCStates(pman=pman)
+        # Share the CPU information object in order to discover the CPU topology only once.
+        rcsobj = CStates.ReqCStates(pman=pman, cpuinfo=cpuinfo)
         csinfo = rcsobj.get_cpu_cstates_info(res.cpunum)
 
-        check_settings(pman, dev, csinfo, args.cpunum, args.devid)
+        check_settings(pman, dev, csinfo, args.cpunum, args.devid, cpuinfo=cpuinfo)
+
+        try:
+            runner = WultRunner.WultRunner(pman, dev, res, ldist=args.ldist,
+                                           intr_focus=args.intr_focus, early_intr=args.early_intr,
+                                           tsc_cal_time=args.tsc_cal_time,
+                                           dcbuf_size=args.dcbuf_size, rcsobj=rcsobj,
+                                           stconf=stconf)
+            stack.enter_context(runner)
 
-        runner = WultRunner.WultRunner(pman, dev, res, ldist=args.ldist, intr_focus=args.intr_focus,
-                                       early_intr=args.early_intr, tsc_cal_time=args.tsc_cal_time,
-                                       dcbuf_size=args.dcbuf_size, rcsobj=rcsobj, stconf=stconf)
-        stack.enter_context(runner)
+            runner.unload = not args.no_unload
+            runner.prepare()
+        except Error:
+            # The drivers or the helpers may be missing or broken on the SUT, make sure the next
+            # run checks the SUT instead of trusting the cached deployment state.
+            Deploy.clear_deploy_state(pman, OWN_NAME)
+            raise
 
-        runner.unload = not args.no_unload
-        runner.prepare()
         runner.run(dpcnt=args.dpcnt, tlimit=args.tlimit, keep_rawdp=args.keep_rawdp)
 
     if not args.report:
@@ -20,13 +20,69 @@ from pepclibs.helperlibs import LocalProcessManager, Trivial
 
 _LOG = logging.getLogger()
 
+# How long to wait for killed processes to die, seconds.
+_KILL_TIMEOUT = 4
+# Delays between checking whether killed processes died, seconds. The last delay is used once the
+# list is exhausted.
+_WAIT_DELAYS = (0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+# The ways to specify the 'SIGTERM' and 'SIGKILL' signals.
+_SIGTERM_NAMES = frozenset(("15", "SIGTERM", "TERM"))
+_SIGKILL_NAMES = frozenset(("9", "SIGKILL", "KILL"))
+
 def _is_sigterm(sig: str):
     """Return 'True' if sig' is the 'SIGTERM' signal."""
-    return sig == "15" or sig.endswith("TERM")
+    return sig in _SIGTERM_NAMES
 
 def _is_sigkill(sig: str):
     """Return 'True' if sig' is the 'SIGKILL' signal."""
-    return sig == "15" or sig.endswith("KILL")
+    return sig in _SIGKILL_NAMES
+
+def _collect_zombies(pman):
+    """In case of a local process we need to 'waitpid()' the children."""
+
+    if not pman.is_remote:
+        with contextlib.suppress(OSError):
+            os.waitpid(0, os.WNOHANG)
+
+def _is_any_gone(pids, pman):
+    """
+    Returns 'True' if any of the processes with PIDs in 'pids' cannot be signaled anymore, which is
+    what the exit code of 'kill -0 -- <pids>' tells. Local processes are checked without running
+    'kill'.
+    """
+
+    if pman.is_remote:
+        pids_spc = " ".join(pids)
+        _, _, exitcode = pman.run(f"kill -0 -- {pids_spc}")
+        return exitcode != 0
+
+    for pid in pids:
+        try:
+            os.kill(int(pid), 0)
+        except OSError:
+            return True
+    return False
+
+def _wait_for_exit(pids, timeout, pman):
+    """
+    Wait for up to 'timeout' seconds for the processes with PIDs in 'pids' to exit (see
+    '_is_any_gone()'). Returns 'True' if the processes exited and 'False' on time out. The checks
+    are done with growing delays, so that processes which exit quickly are noticed quickly, and
+    processes which take long to exit do not cause too many checks.
+    """
+
+    start_time = time.time()
+    delays = iter(_WAIT_DELAYS)
+    while True:
+        _collect_zombies(pman)
+        if _is_any_gone(pids, pman):
+            return True
+
+        remaining = timeout - (time.time() - start_time)
+        if remaining <= 0:
+            return False
+        time.sleep(min(next(delays, _WAIT_DELAYS[-1]), remaining))
 
 def is_root(pman=None):
     """
@@ -66,13 +122,6 @@ def kill_pids(pids, sig: str = "SIGTERM", kill_children: bool = False, must_die:
     default).
     """
 
-    def collect_zombies(pman):
-        """In case of a local process we need to 'waitpid()' the children."""
-
-        if not pman.is_remote:
-            with contextlib.suppress(OSError):
-                os.waitpid(0, os.WNOHANG)
-
     if not pman:
         pman = LocalProcessManager.LocalProcessManager()
 
@@ -94,12 +143,21 @@ def kill_pids(pids, sig: str = "SIGTERM", kill_children: bool = False, must_die:
         raise Error(f"'children' and 'must_die' arguments cannot be used with '{sig}' signal")
 
     if kill_children:
-        # Find all the children of the process.
-        for pid in pids:
-            children, _, exitcode = pman.run(f"pgrep -P {pid}", join=False)
+        # Find all the descendants of the processes, one generation at a time.
+        seen = set(pids)
+        parents = pids
+        while parents:
+            children, _, exitcode = pman.run(f"pgrep -P {','.join(parents)}", join=False)
             if exitcode != 0:
                 break
-            pids += [child.strip() for child in children]
+
+            parents = []
+            for child in children:
+                child = child.strip()
+                if child and child not in seen:
+                    seen.add(child)
+                    parents.append(child)
+            pids += parents
 
     pids_spc = " ".join(pids)
     pids_comma = ",".join(pids)
@@ -125,15 +183,9 @@ def kill_pids(pids, sig: str = "SIGTERM", kill_children: bool = False, must_die:
     if not killing:
         return
 
-    # Give the processes up to 4 seconds to die.
-    timeout = 4
-    start_time = time.time()
-    while time.time() - start_time <= timeout:
-        collect_zombies(pman)
-        _, _, exitcode = pman.run(f"kill -0 -- {pids_spc}")
-        if exitcode == 1:
-            return
-        time.sleep(0.2)
+    # Give the processes some time to die.
+    if _wait_for_exit(pids, _KILL_TIMEOUT, pman):
+        return
 
     if _is_sigterm(sig):
         # Something refused to die, try SIGKILL.
@@ -143,18 +195,11 @@ def kill_pids(pids, sig: str = "SIGTERM", kill_children: bool = False, must_die:
             # It is fine if one of the processes exited meanwhile.
             if "No such process" not in str(err):
                 raise
-        collect_zombies(pman)
+        _collect_zombies(pman)
         if not must_die:
             return
-        # Give the processes up to 4 seconds to die.
-        timeout = 4
-        start_time = time.time()
-        while time.time() - start_time <= timeout:
-            collect_zombies(pman)
-            _, _, exitcode = pman.run(f"kill -0 -- {pids_spc}")
-            if exitcode != 0:
-                return
-            time.sleep(0.2)
+        if _wait_for_exit(pids, _KILL_TIMEOUT, pman):
+            return
 
     # Something refused to die, find out what.
     msg, _, = pman.run_verify(f"ps -f {pids_spc}", join=False)
@@ -163,6 +208,81 @@ def kill_pids(pids, sig: str = "SIGTERM", kill_children: bool = False, must_die:
 
     raise Error(f"one of the following processes{pman.hostmsg} did not die after 'SIGKILL': {msg}")
 
+def _get_processes_ps(pman):
+    """
+    Return the list of '(pid, cmdline)' tuples for all processes on the host defined by 'pman'.
+    Uses the 'ps' tool.
+    """
+
+    cmd = "ps axo pid,args"
+    stdout, stderr = pman.run_verify(cmd, join=False)
+
+    if len(stdout) < 2:
+        raise Error(f"no processes found at all{pman.hostmsg}\nExecuted this command:\n{cmd}\n"
+                    f"stdout:\n{stdout}\nstderr:{stderr}\n")
+
+    procs = []
+    for line in stdout[1:]:
+        pid, _, comm = line.strip().partition(" ")
+        procs.append((int(pid), comm))
+
+    return procs
+
+def _is_proc_restricted():
+    """
+    Return 'True' if '/proc' on the local host is mounted with the 'hidepid' option, which hides
+    other users' processes or makes their '/proc' entries unreadable.
+    """
+
+    try:
+        with open("/proc/mounts", "r") as fobj:
+            for line in fobj:
+                fields = line.split()
+                if len(fields) < 4 or fields[1] != "/proc":
+                    continue
+                for opt in fields[3].split(","):
+                    if opt.startswith("hidepid=") and opt not in ("hidepid=0", "hidepid=off"):
+                        return True
+    except OSError:
+        return True
+
+    return False
+
+def _get_processes_local():
+    """
+    Return the list of '(pid, cmdline)' tuples for all processes on the local host. Reads '/proc'
+    directly and formats the command line the same way as 'ps axo pid,args' does.
+
+    There are minor differences from 'ps' though: zombie processes are reported as '[name]' rather
+    than '[name] <defunct>', and processes with unreadable '/proc' entries (e.g., because they exited
+    while being read) are skipped instead of being listed.
+    """
+
+    procs = []
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+
+        # The process may exit any time, ignore the errors.
+        try:
+            with open(f"{entry.path}/cmdline", "rb") as fobj:
+                cmdline = fobj.read()
+            if cmdline:
+                comm = cmdline.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
+            else:
+                # Kernel threads have no command line, 'ps' prints their name in brackets.
+                with open(f"{entry.path}/comm", "rb") as fobj:
+                    comm = f"[{fobj.read().rstrip().decode(errors='replace')}]"
+        except OSError:
+            continue
+
+        procs.append((int(entry.name), comm))
+
+    if not procs:
+        raise Error("no processes found at all in '/proc'")
+
+    return procs
+
 def find_processes(regex: str, pman=None):
     """
     Find all processes which match the 'regex' regular expression on the host defined by 'pman'. The
@@ -177,21 +297,23 @@ def find_processes(regex: str, pman=None):
     if not pman:
         pman = LocalProcessManager.LocalProcessManager()
 
-    cmd = "ps axo pid,args"
-    stdout, stderr = pman.run_verify(cmd, join=False)
+    if pman.is_remote or _is_proc_restricted():
+        allprocs = _get_processes_ps(pman)
+    else:
+        allprocs = _get_processes_local()
 
-    if len(stdout) < 2:
-        raise Error(f"no processes found at all{pman.hostmsg}\nExecuted this command:\n{cmd}\n"
-                    f"stdout:\n{stdout}\nstderr:{stderr}\n")
+    regex = re.compile(regex)
+    if pman.hostname == "localhost":
+        ownpid = Trivial.get_pid()
+    else:
+        ownpid = None
 
     procs = []
-    for line in stdout[1:]:
-        pid, comm = line.strip().split(" ", 1)
-        pid = int(pid)
-        if pman.hostname == "localhost" and pid == Trivial.get_pid():
+    for pid, comm in allprocs:
+        if pid == ownpid:
             continue
-        if re.search(regex, comm):
-            procs.append((int(pid), comm))
+        if regex.search(comm):
+            procs.append((pid, comm))
 
     return procs
 
@@ -13,6 +13,7 @@ human-readable. This module contains helper function for dealing with a report I
 
 import re
 import time
+from functools import lru_cache
 from pepclibs.helperlibs.Exceptions import Error
 
 MAX_REPORID_LEN = 64
@@ -22,6 +23,7 @@ SPECIAL_CHARS = "-.,_~"
 # Just a unique object used as default value in few places.
 _RAISE = object()
 
+@lru_cache(maxsize=None)
 def get_charset_descr(additional_chars=""):
     """
     Returns a string describing the allow report ID characters. The 'additional_chars' argument is a
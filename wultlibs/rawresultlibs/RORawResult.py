@@ -14,6 +14,7 @@ import builtins
 import re
 import logging
 from pathlib import Path
+from functools import lru_cache
 import pandas
 from pepclibs.helperlibs import YAML
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported, ErrorNotFound
@@ -22,6 +23,21 @@ from wultlibs.rawresultlibs import _RawResultBase
 
 _LOG = logging.getLogger()
 
+# The special 'index' name in row filter and selector expressions.
+_INDEX_RE = re.compile("(?!')index(?!')")
+
+@lru_cache(maxsize=128)
+def _mangle_eval_expr(expr, colnames):
+    """
+    Implements 'RORawResult._mangle_eval_expr()'. The mangled expressions are cached, because the
+    same expression is usually applied to many test results with the same column names.
+    """
+
+    for colname in colnames:
+        expr = expr.replace(colname, f"self.df['{colname}']")
+    # The special 'index' name represents the row number (first data row has index '0').
+    return _INDEX_RE.sub("self.df.index", expr)
+
 class RORawResult(_RawResultBase.RawResultBase):
     """This class represents a read-only raw test result."""
 
@@ -69,12 +85,7 @@ class RORawResult(_RawResultBase.RawResultBase):
         if expr is None:
             return None
 
-        expr = str(expr)
-        for colname in self.colnames:
-            expr = expr.replace(colname, f"self.df['{colname}']")
-        # The special 'index' name represents the row number (first data row has index '0').
-        expr = re.sub("(?!')index(?!')", "self.df.index", expr)
-        return expr
+        return _mangle_eval_expr(str(expr), tuple(self.colnames))
 
     def set_rfilt(self, rfilt):
         """
@@ -184,16 +195,24 @@ class RORawResult(_RawResultBase.RawResultBase):
 
             self.smrys[colname] = subdict
 
+    def _get_read_csv_kwargs(self):
+        """Returns the common 'pandas.read_csv()' keyword arguments for the datapoints CSV file."""
+
+        if not self._read_csv_kwargs:
+            # Enforce the types we expect, which also saves 'pandas' from inferring them. The
+            # datapoints CSV file is a local file, so let 'pandas' memory-map it.
+            dtype = {colname : colinfo["type"] for colname, colinfo in self.defs.info.items()}
+            self._read_csv_kwargs = {"dtype" : dtype, "engine" : "c", "memory_map" : True}
+
+        return self._read_csv_kwargs
+
     def _load_csv(self, **kwargs):
         """Read the datapoints CSV file into a 'pandas.DataFrame' and validate it."""
 
         _LOG.info("Loading test result '%s'.", self.dp_path)
 
-        # Enforce the types we expect.
-        dtype = {colname : colinfo["type"] for colname, colinfo in self.defs.info.items()}
-
         try:
-            self.df = pandas.read_csv(self.dp_path, dtype=dtype, **kwargs)
+            self.df = pandas.read_csv(self.dp_path, **self._get_read_csv_kwargs(), **kwargs)
         except Exception as err:
             raise Error(f"failed to load CSV file {self.dp_path}:\n{err}") from None
 
@@ -205,6 +224,62 @@ class RORawResult(_RawResultBase.RawResultBase):
         if self.df.empty:
             raise Error(f"no data in CSV file '{self.dp_path}'")
 
+    def _get_nonempty_csel(self):
+        """
+        Same as '_get_csel(self.colnames)', but raise an exception if the columns filters and
+        selectors exclude all the columns.
+        """
+
+        csel = self._get_csel(self.colnames)
+        if csel is not None and not csel:
+            raise Error(f"no data left after applying column selector(s) to CSV file "
+                        f"'{self.dp_path}'")
+        return csel
+
+    def iter_df_chunks(self, chunksize):
+        """
+        Read the datapoints CSV file in chunks of up to 'chunksize' rows, apply the configured
+        columns filters and selectors, and yield a 'pandas.DataFrame' for every chunk. This allows
+        for processing large test results without loading all the datapoints into the memory. The
+        rows filters and selectors require the entire 'pandas.DataFrame', so they are not supported
+        by this method.
+        """
+
+        if self._get_rsel():
+            raise Error("rows filters and selectors are not supported for chunked reading")
+
+        _LOG.info("Loading test result '%s'.", self.dp_path)
+
+        csel = self._get_nonempty_csel()
+
+        try:
+            reader = pandas.read_csv(self.dp_path, usecols=csel, chunksize=chunksize,
+                                     **self._get_read_csv_kwargs())
+        except Exception as err:
+            raise Error(f"failed to load CSV file {self.dp_path}:\n{err}") from None
+
+        empty = True
+        try:
+            while True:
+                try:
+                    chunk = next(reader)
+                except StopIteration:
+                    break
+                except Exception as err:
+                    raise Error(f"failed to load CSV file {self.dp_path}:\n{err}") from None
+
+                if chunk.isnull().values.any():
+                    raise Error(f"CSV file '{self.dp_path}' include datapoints with too few values "
+                                f"(one or more incomplete row).")
+
+                empty = False
+                yield chunk
+        finally:
+            reader.close()
+
+        if empty:
+            raise Error(f"no data in CSV file '{self.dp_path}'")
+
     def _load_df(self, force_reload=False, **kwargs):
         """
         Apply all the filters and selectors to 'self.df'. Load it from the datapoints CSV file if it
@@ -213,7 +288,7 @@ class RORawResult(_RawResultBase.RawResultBase):
         """
 
         rsel = self._get_rsel()
-        csel = self._get_csel(self.colnames)
+        csel = self._get_nonempty_csel()
 
         load_csv = force_reload or self.df is None
 
@@ -404,6 +479,8 @@ class RORawResult(_RawResultBase.RawResultBase):
 
         # Unknown columns in the CSV file.
         self._ignored_colnames = None
+        # The 'pandas.read_csv()' keyword arguments for the datapoints CSV file.
+        self._read_csv_kwargs = None
 
         self.df = None
         self.smrys = None
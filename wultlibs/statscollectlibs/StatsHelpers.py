@@ -38,7 +38,10 @@ def parse_stnames(stnames):
     stconf["exclude"] = set()
     stconf["discover"] = False
 
-    for stname in Trivial.split_csv_line(stnames):
+    for stname in stnames.split(","):
+        stname = stname.strip()
+        if not stname:
+            continue
         if stname == "all":
             stconf["discover"] = True
         elif stname.startswith("!"):
@@ -47,8 +50,7 @@ def parse_stnames(stnames):
         else:
             stconf["include"].add(stname)
 
-    StatsCollect._check_stnames(stconf["include"])
-    StatsCollect._check_stnames(stconf["exclude"])
+    StatsCollect._check_stnames(stconf["include"] | stconf["exclude"])
     stconf["include"] -= stconf["exclude"]
 
     return stconf
@@ -66,13 +68,18 @@ def parse_intervals(intervals, stconf):
     """
 
     stconf["intervals"] = {}
-    for entry in Trivial.split_csv_line(intervals):
-        split = Trivial.split_csv_line(entry, sep=":")
-        if len(split) != 2:
+    for entry in intervals.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+
+        stname, sep, interval = entry.partition(":")
+        stname = stname.strip()
+        interval = interval.strip()
+        if not sep or not stname or not interval or ":" in interval:
             raise Error(f"bad intervals entry '{entry}', should be 'stname:interval', where "
                         f"'stname' is the statistics name and 'interval' is a floating point "
                         f"interval for collecting the 'stname' statistics.")
-        stname, interval = split
         StatsCollect._check_stname(stname)
 
         if not Trivial.is_float(interval):